@@ -5,9 +5,10 @@ Wraps existing laskd_* modules to provide a consistent interface.
 """
 from __future__ import annotations
 
-import os
 import re
+import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
@@ -16,14 +17,20 @@ from askd_runtime import log_path, write_log
 from ccb_protocol import BEGIN_PREFIX, REQ_ID_PREFIX
 from claude_comm import ClaudeLogReader
 from completion_hook import notify_completion
+from env_utils import env_float, env_int
 from laskd_registry import get_session_registry
 from laskd_protocol import extract_reply_for_req, is_done_text, wrap_claude_prompt
 from laskd_session import compute_session_key, load_project_session
 from providers import LASKD_SPEC
-from session_file_watcher import HAS_WATCHDOG
+from session_file_watcher import HAS_WATCHDOG, get_shared_watcher
 from terminal import get_backend_for_session
 
 
+# Read once at import: the daemon's environment does not change while it runs.
+_REBIND_TAIL_BYTES = env_int("CCB_LASKD_REBIND_TAIL_BYTES", 2 * 1024 * 1024)
+_PANE_CHECK_INTERVAL_S = env_float("CCB_LASKD_PANE_CHECK_INTERVAL", 2.0)
+
+
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
@@ -32,43 +39,100 @@ def _write_log(line: str) -> None:
     write_log(log_path(LASKD_SPEC.log_file_name), line)
 
 
-def _tail_state_for_log(log_path_val: Optional[Path], *, tail_bytes: int) -> dict:
-    if not log_path_val or not log_path_val.exists():
-        return {"session_path": log_path_val, "offset": 0, "carry": b""}
-    try:
-        size = log_path_val.stat().st_size
-    except OSError:
-        size = 0
+def _tail_state_for_log(log_path_val: Optional[Path], *, tail_bytes: int, size: Optional[int] = None) -> dict:
+    if not log_path_val:
+        return {"session_path": None, "offset": 0, "carry": b""}
+    if size is None:
+        # A missing log stats as size 0, i.e. read it from the start once it appears.
+        try:
+            size = log_path_val.stat().st_size
+        except OSError:
+            size = 0
     offset = max(0, size - max(0, int(tail_bytes)))
     return {"session_path": log_path_val, "offset": offset, "carry": b""}
 
 
+class _LogWatch:
+    """
+    Wakes a log reader's blocking reads on changes in the project dir of the log it reads (needs watchdog).
+
+    follow() moves the subscription when the wait switches logs or readers, e.g. when the anchor fallback
+    rebinds to a session in another project dir; reads of logs it does not cover keep polling.
+    """
+
+    def __init__(self) -> None:
+        self._log_reader: Optional[ClaudeLogReader] = None
+        self._project_dir: Optional[Path] = None
+        self._change_event: Optional[threading.Event] = None
+
+    def follow(self, log_reader: ClaudeLogReader, session_path: Optional[Path]) -> None:
+        project_dir = Path(session_path).parent if session_path else None
+        if self._change_event is not None and project_dir == self._project_dir:
+            if log_reader is not self._log_reader:
+                self._log_reader = log_reader
+                log_reader.set_change_event(self._change_event, watched_dir=project_dir)
+            return
+        self.stop()
+        if project_dir is None or not project_dir.is_dir():
+            return
+        change_event = threading.Event()
+        try:
+            if not get_shared_watcher().subscribe(project_dir, change_event):
+                return
+        except Exception as exc:
+            _write_log(f"[WARN] claude log watcher start failed dir={project_dir}: {exc}")
+            return
+        self._log_reader = log_reader
+        self._project_dir = project_dir
+        self._change_event = change_event
+        log_reader.set_change_event(change_event, watched_dir=project_dir)
+
+    def stop(self) -> None:
+        log_reader, project_dir, change_event = self._log_reader, self._project_dir, self._change_event
+        self._log_reader = None
+        self._project_dir = None
+        self._change_event = None
+        if log_reader is None or project_dir is None or change_event is None:
+            return
+        log_reader.set_change_event(None)
+        get_shared_watcher().unsubscribe(project_dir, change_event)
+
+
 _BOX_TABLE_CHARS = {"┌", "┬", "┐", "├", "┼", "┤", "└", "┴", "┘", "│", "─"}
+_BOX_TABLE_RE = re.compile("[" + "".join(sorted(_BOX_TABLE_CHARS)) + "]")
+_SECTION_HEAD_RE = re.compile(r"^(?:###\s*)?Section\s+(\d+)$", re.IGNORECASE)
+_SECTION_HEAD_ANY_RE = re.compile(r"^(?:###\s*)?Section\s+\d+$", re.IGNORECASE)
+_NUMBERED_RE = re.compile(r"^\d+[\.\)]")
+# Every _wants_* predicate (and the box-table check) requires at least one of these in the message.
+_FIXUP_TRIGGERS = ("code block", "markdown", "release notes", "### section", "## a")
+_CODE_BLOCK_ZH = "\u4ee3\u7801\u5757"
 
 
-def _wants_triplet_fences(message: str) -> bool:
-    msg = (message or "").lower()
+def _may_want_fixups(message: str, msg: str) -> bool:
+    if _CODE_BLOCK_ZH in message:
+        return True
+    return any(trigger in msg for trigger in _FIXUP_TRIGGERS)
+
+
+def _wants_triplet_fences(message: str, msg: str) -> bool:
     if ("python" in msg) and ("json" in msg) and ("yaml" in msg):
-        return ("code block" in msg) or ("\u4ee3\u7801\u5757" in (message or ""))
+        return ("code block" in msg) or (_CODE_BLOCK_ZH in message)
     return False
 
 
-def _wants_bash_fence(message: str) -> bool:
-    msg = (message or "").lower()
+def _wants_bash_fence(message: str, msg: str) -> bool:
     if "bash" in msg:
-        return ("code block" in msg) or ("\u4ee3\u7801\u5757" in (message or ""))
+        return ("code block" in msg) or (_CODE_BLOCK_ZH in message)
     return False
 
 
-def _wants_text_fence(message: str) -> bool:
-    msg = (message or "").lower()
+def _wants_text_fence(message: str, msg: str) -> bool:
     if "```text" in msg or "text" in msg:
-        return ("code block" in msg) or ("\u4ee3\u7801\u5757" in (message or ""))
+        return ("code block" in msg) or (_CODE_BLOCK_ZH in message)
     return False
 
 
-def _wants_release_notes(message: str) -> bool:
-    msg = (message or "").lower()
+def _wants_release_notes(msg: str) -> bool:
     if "release notes" not in msg:
         return False
     return ("summary" in msg) and ("item" in msg) and ("risk" in msg) and ("action" in msg)
@@ -82,39 +146,73 @@ def _looks_like_release_notes_reply(reply: str) -> bool:
         return True
     return False
 
-def _wants_abc_sections(message: str) -> bool:
-    msg = (message or "").lower()
+def _wants_abc_sections(msg: str) -> bool:
     return "## a" in msg and "## b" in msg and "## c" in msg
 
 
-def _wants_section_10(message: str) -> bool:
-    msg = (message or "").lower()
+def _wants_section_10(msg: str) -> bool:
     return "### section" in msg and "1..10" in msg
 
 
-def _has_fence(reply: str) -> bool:
-    return "```" in (reply or "")
+def _rstrip_lines(lines: list[str]) -> list[str]:
+    """Line-list equivalent of `"\\n".join(lines).rstrip().splitlines()`."""
+    end = len(lines)
+    while end and not lines[end - 1].strip():
+        end -= 1
+    out = lines[:end]
+    if out:
+        out[-1] = out[-1].rstrip()
+    return out
 
 
 def _is_box_table_line(line: str) -> bool:
-    return any(ch in line for ch in _BOX_TABLE_CHARS)
+    return _BOX_TABLE_RE.search(line) is not None
 
 
-def _should_fix_box_table(message: str, reply: str) -> bool:
-    if not reply:
-        return False
-    if not _is_box_table_line(reply):
-        return False
-    msg = (message or "").lower()
+def _wants_markdown_table(message: str, msg: str) -> bool:
     if "markdown" not in msg:
         return False
-    return ("table" in msg) or ("\u8868\u683c" in (message or ""))
+    return ("table" in msg) or ("\u8868\u683c" in message)
+
+
+@dataclass(frozen=True)
+class _ReplyPolicy:
+    """Which reply fixups a request message asks for; computed once per request."""
+    markdown_table: bool = False
+    triplet_fences: bool = False
+    bash_fence: bool = False
+    text_fence: bool = False
+    release_notes: bool = False
+    abc_sections: bool = False
+    section_10: bool = False
+
+    @classmethod
+    def from_message(cls, message: str) -> "_ReplyPolicy":
+        message = message or ""
+        msg = message.lower()
+        if not _may_want_fixups(message, msg):
+            return _PLAIN_REPLY_POLICY
+        return cls(
+            markdown_table=_wants_markdown_table(message, msg),
+            triplet_fences=_wants_triplet_fences(message, msg),
+            bash_fence=_wants_bash_fence(message, msg),
+            text_fence=_wants_text_fence(message, msg),
+            release_notes=_wants_release_notes(msg),
+            abc_sections=_wants_abc_sections(msg),
+            section_10=_wants_section_10(msg),
+        )
+
+    @property
+    def plain(self) -> bool:
+        return self == _PLAIN_REPLY_POLICY
+
 
+_PLAIN_REPLY_POLICY = _ReplyPolicy()
 
-def _convert_box_table_to_markdown(text: str) -> str:
-    lines = (text or "").splitlines()
+
+def _convert_box_table_to_markdown(lines: list[str]) -> list[str]:
     if not lines:
-        return text
+        return lines
     start = None
     end = None
     for i, ln in enumerate(lines):
@@ -129,7 +227,7 @@ def _convert_box_table_to_markdown(text: str) -> str:
                 continue
             break
     if start is None or end is None:
-        return text
+        return lines
 
     block = lines[start : end + 1]
     rows: list[list[str]] = []
@@ -144,12 +242,12 @@ def _convert_box_table_to_markdown(text: str) -> str:
             continue
         rows.append(parts)
     if not rows:
-        return text
+        return lines
 
     header = rows[0]
     col_count = len(header)
     if col_count == 0:
-        return text
+        return lines
     header = [c or "" for c in header]
     sep = ["---"] * col_count
     out = [
@@ -160,8 +258,7 @@ def _convert_box_table_to_markdown(text: str) -> str:
         row = (row + [""] * col_count)[:col_count]
         out.append("| " + " | ".join(row) + " |")
 
-    rebuilt = lines[:start] + out + lines[end + 1 :]
-    return "\n".join(rebuilt).rstrip()
+    return _rstrip_lines(lines[:start] + out + lines[end + 1 :])
 
 
 def _split_blocks(lines: list[str]) -> list[list[str]]:
@@ -179,14 +276,25 @@ def _split_blocks(lines: list[str]) -> list[list[str]]:
     return blocks
 
 
-def _fix_triplet_fences(reply: str) -> str:
-    lines = (reply or "").splitlines()
-    if _has_fence(reply):
-        py_count = reply.count("```python")
-        json_count = reply.count("```json")
-        yaml_count = reply.count("```yaml")
-        if py_count == 1 and json_count == 1 and yaml_count == 1:
-            return reply
+def _fence_counts(lines: list[str]) -> Optional[dict[str, int]]:
+    """Tally ```python/```json/```yaml fences in one pass; None when there is no fence at all."""
+    counts: Optional[dict[str, int]] = None
+    for ln in lines:
+        if "```" not in ln:
+            continue
+        if counts is None:
+            counts = {"python": 0, "json": 0, "yaml": 0}
+        for tag in counts:
+            counts[tag] += ln.count(f"```{tag}")
+    return counts
+
+
+def _fix_triplet_fences(reply_lines: list[str]) -> list[str]:
+    lines = reply_lines
+    counts = _fence_counts(lines)
+    if counts is not None:
+        if counts["python"] == 1 and counts["json"] == 1 and counts["yaml"] == 1:
+            return reply_lines
         lines = [ln for ln in lines if not ln.strip().startswith("```")]
 
     def _first_idx(pred) -> int | None:
@@ -209,9 +317,9 @@ def _fix_triplet_fences(reply: str) -> str:
     segments.sort(key=lambda x: x[1])
 
     if not segments:
-        return reply
+        return reply_lines
 
-    out_blocks: list[str] = []
+    out_blocks: list[list[str]] = []
     for idx, (tag, start) in enumerate(segments):
         end = segments[idx + 1][1] if idx + 1 < len(segments) else len(lines)
         seg_lines = [ln for ln in lines[start:end]]
@@ -222,23 +330,27 @@ def _fix_triplet_fences(reply: str) -> str:
         text = "\n".join(seg_lines).strip()
         if not text:
             continue
-        out_blocks.append(f"```{tag}\n{text}\n```")
-    return "\n\n".join(out_blocks).rstrip()
+        out_blocks.append([f"```{tag}", *text.splitlines(), "```"])
+    out: list[str] = []
+    for block in out_blocks:
+        if out:
+            out.append("")
+        out.extend(block)
+    return out
 
 
-def _fix_bash_fence(reply: str) -> str:
-    if _has_fence(reply):
-        return reply
-    lines = (reply or "").splitlines()
+def _fix_bash_fence(lines: list[str]) -> list[str]:
+    if _fence_counts(lines) is not None:
+        return lines
     if not lines:
-        return reply
+        return lines
     start = None
     for i, line in enumerate(lines):
         if line.strip():
             start = i
             break
     if start is None:
-        return reply
+        return lines
     script: list[str] = []
     i = start
     while i < len(lines):
@@ -250,7 +362,7 @@ def _fix_bash_fence(reply: str) -> str:
         script.append(line)
         i += 1
     if not script:
-        return reply
+        return lines
     rest = lines[i:]
     while rest and rest[0].strip() == "":
         rest = rest[1:]
@@ -260,20 +372,20 @@ def _fix_bash_fence(reply: str) -> str:
     if rest:
         out.append("")
         out.extend(rest)
-    return "\n".join(out).rstrip()
+    return _rstrip_lines(out)
 
 
-def _fix_text_fence(reply: str) -> str:
-    if _has_fence(reply):
-        return reply
-    body = (reply or "").strip()
+def _fix_text_fence(lines: list[str]) -> list[str]:
+    if _fence_counts(lines) is not None:
+        return lines
+    body = "\n".join(lines).strip()
     if not body:
-        return reply
-    return f"```text\n{body}\n```"
+        return lines
+    return ["```text", *body.splitlines(), "```"]
 
 
-def _fix_abc_sections(reply: str) -> str:
-    lines = (reply or "").splitlines()
+def _fix_abc_sections(reply_lines: list[str]) -> list[str]:
+    lines = list(reply_lines)
     for i, line in enumerate(lines):
         stripped = line.strip()
         if stripped in ("A", "B", "C"):
@@ -297,7 +409,7 @@ def _fix_abc_sections(reply: str) -> str:
             out.extend(bullets[:2])
             continue
         i += 1
-    return "\n".join(out).rstrip()
+    return _rstrip_lines(out)
 
 
 def _split_to_two_lines(text: str) -> tuple[str, str]:
@@ -318,13 +430,12 @@ def _split_to_two_lines(text: str) -> tuple[str, str]:
     return text[:mid].strip(), text[mid:].strip()
 
 
-def _fix_section_10(reply: str) -> str:
-    lines = (reply or "").splitlines()
+def _fix_section_10(lines: list[str]) -> list[str]:
     out: list[str] = []
     i = 0
     while i < len(lines):
         line = lines[i].strip()
-        m = re.match(r"^(?:###\s*)?Section\s+(\d+)$", line, re.IGNORECASE)
+        m = _SECTION_HEAD_RE.match(line)
         if m:
             num = m.group(1)
             out.append(f"### Section {num}")
@@ -332,7 +443,7 @@ def _fix_section_10(reply: str) -> str:
             desc: list[str] = []
             while i < len(lines):
                 nxt = lines[i].strip()
-                if re.match(r"^(?:###\s*)?Section\s+\d+$", nxt, re.IGNORECASE):
+                if _SECTION_HEAD_ANY_RE.match(nxt):
                     break
                 if nxt:
                     desc.append(nxt)
@@ -348,11 +459,11 @@ def _fix_section_10(reply: str) -> str:
                 out.append("")
             continue
         i += 1
-    return "\n".join(out).rstrip()
+    return _rstrip_lines(out)
 
 
-def _fix_release_notes(reply: str) -> str:
-    raw_lines = [ln.rstrip() for ln in (reply or "").splitlines()]
+def _fix_release_notes(lines: list[str]) -> list[str]:
+    raw_lines = [ln.rstrip() for ln in lines]
     stripped_lines = [ln.strip() for ln in raw_lines if ln.strip()]
     summary_line = None
     for ln in stripped_lines:
@@ -378,7 +489,7 @@ def _fix_release_notes(reply: str) -> str:
         if len(words) > 21:
             summary_line = " ".join(words[:21])
 
-    numbered = [ln for ln in stripped_lines if re.match(r"^\d+[\.\)]", ln)]
+    numbered = [ln for ln in stripped_lines if _NUMBERED_RE.match(ln)]
     numbered = numbered[:4]
 
     table_lines = [ln for ln in raw_lines if ln.strip().startswith("|") and "|" in ln]
@@ -429,7 +540,7 @@ def _fix_release_notes(reply: str) -> str:
                 continue
             if ln.strip().startswith("|"):
                 continue
-            if re.match(r"^\d+[\.\)]", ln):
+            if _NUMBERED_RE.match(ln):
                 continue
             candidates.append(ln)
         if candidates:
@@ -450,7 +561,7 @@ def _fix_release_notes(reply: str) -> str:
         out.extend(numbered)
     if table_lines:
         out.extend(table_lines)
-    return "\n".join(out).rstrip()
+    return _rstrip_lines(out)
 
 class ClaudeAdapter(BaseProviderAdapter):
     """Adapter for Claude provider."""
@@ -525,7 +636,7 @@ class ClaudeAdapter(BaseProviderAdapter):
                 done_seen=False,
             )
 
-        deadline = None if float(req.timeout_s) < 0.0 else (time.time() + float(req.timeout_s))
+        deadline = None if float(req.timeout_s) < 0.0 else (time.monotonic() + float(req.timeout_s))
 
         log_reader = ClaudeLogReader(work_dir=Path(session.work_dir))
         if session.claude_session_path:
@@ -540,12 +651,19 @@ class ClaudeAdapter(BaseProviderAdapter):
         else:
             prompt = wrap_claude_prompt(req.message, task.req_id)
         backend.send_text(pane_id, prompt)
+        policy = _ReplyPolicy.from_message(req.message)
 
         # Use structured Claude session logs only
-        result = self._wait_for_response(
-            task, session, session_key, started_ms, log_reader, state, backend, pane_id, deadline
-        )
-        result.reply = self._postprocess_reply(req, result.reply)
+        log_watch = _LogWatch()
+        log_watch.follow(log_reader, state.get("session_path"))
+        try:
+            result = self._wait_for_response(
+                task, session, session_key, started_ms, log_reader, state, backend, pane_id, deadline,
+                log_watch=log_watch,
+            )
+        finally:
+            log_watch.stop()
+        result.reply = self._postprocess_reply(req, result.reply, policy)
         self._finalize_result(result, req)
         return result
 
@@ -565,32 +683,50 @@ class ClaudeAdapter(BaseProviderAdapter):
             work_dir=req.work_dir,
         )
 
-    def _postprocess_reply(self, req: ProviderRequest, reply: str) -> str:
-        fixed = reply
-        if _should_fix_box_table(req.message, fixed):
-            fixed = _convert_box_table_to_markdown(fixed)
-        if _wants_triplet_fences(req.message):
-            fixed = _fix_triplet_fences(fixed)
-        if _wants_bash_fence(req.message):
-            fixed = _fix_bash_fence(fixed)
-        if _wants_text_fence(req.message):
-            fixed = _fix_text_fence(fixed)
-        if _wants_release_notes(req.message) or _looks_like_release_notes_reply(fixed):
-            fixed = _fix_release_notes(fixed)
-        if _wants_abc_sections(req.message):
-            fixed = _fix_abc_sections(fixed)
-        if _wants_section_10(req.message):
-            fixed = _fix_section_10(fixed)
-        return fixed
+    def _postprocess_reply(self, req: ProviderRequest, reply: str, policy: Optional[_ReplyPolicy] = None) -> str:
+        reply = reply or ""
+        if policy is None:
+            policy = _ReplyPolicy.from_message(req.message)
+        if policy.plain:
+            # Plain request: only the reply-driven release notes fixup can apply.
+            if _looks_like_release_notes_reply(reply):
+                return "\n".join(_fix_release_notes(reply.splitlines()))
+            return reply
+        # Split once; each fixup maps lines -> lines and returns its input unchanged when it does not apply.
+        original = reply.splitlines()
+        lines = original
+        if policy.markdown_table and _is_box_table_line(reply):
+            lines = _convert_box_table_to_markdown(lines)
+        if policy.triplet_fences:
+            lines = _fix_triplet_fences(lines)
+        if policy.bash_fence:
+            lines = _fix_bash_fence(lines)
+        if policy.text_fence:
+            lines = _fix_text_fence(lines)
+        if policy.release_notes or _looks_like_release_notes_reply(
+            reply if lines is original else "\n".join(lines)
+        ):
+            lines = _fix_release_notes(lines)
+        if policy.abc_sections:
+            lines = _fix_abc_sections(lines)
+        if policy.section_10:
+            lines = _fix_section_10(lines)
+        if lines is original:
+            return reply
+        return "\n".join(lines)
 
     def _wait_for_response(
         self, task: QueuedTask, session: Any, session_key: str,
         started_ms: int, log_reader: ClaudeLogReader, state: dict,
-        backend: Any, pane_id: str, deadline: Optional[float] = None
+        backend: Any, pane_id: str, deadline: Optional[float] = None,
+        log_watch: Optional[_LogWatch] = None,
     ) -> ProviderResult:
         req = task.request
+        # Deadlines here are time.monotonic() values; read the clock once per loop step.
+        clock = time.monotonic
+        now = clock()
         if deadline is None:
-            deadline = None if float(req.timeout_s) < 0.0 else (time.time() + float(req.timeout_s))
+            deadline = None if float(req.timeout_s) < 0.0 else (now + float(req.timeout_s))
         chunks: list[str] = []
         anchor_seen = False
         fallback_scan = False
@@ -598,23 +734,25 @@ class ClaudeAdapter(BaseProviderAdapter):
         done_seen = False
         done_ms: Optional[int] = None
 
-        anchor_grace_deadline = min(deadline, time.time() + 1.5) if deadline else (time.time() + 1.5)
-        anchor_collect_grace = min(deadline, time.time() + 2.0) if deadline else (time.time() + 2.0)
+        anchor_grace_deadline = min(deadline, now + 1.5) if deadline else (now + 1.5)
+        anchor_collect_grace = min(deadline, now + 2.0) if deadline else (now + 2.0)
         rebounded = False
-        tail_bytes = int(os.environ.get("CCB_LASKD_REBIND_TAIL_BYTES", str(2 * 1024 * 1024)))
-        pane_check_interval = float(os.environ.get("CCB_LASKD_PANE_CHECK_INTERVAL", "2.0"))
-        last_pane_check = time.time()
+        anchor_needle = f"{REQ_ID_PREFIX} {task.req_id}"
+        tail_bytes = _REBIND_TAIL_BYTES
+        pane_check_interval = _PANE_CHECK_INTERVAL_S
+        last_pane_check = now
 
         while True:
+            now = clock()
             if deadline is not None:
-                remaining = deadline - time.time()
+                remaining = deadline - now
                 if remaining <= 0:
                     break
                 wait_step = min(remaining, 0.5)
             else:
                 wait_step = 0.5
 
-            if time.time() - last_pane_check >= pane_check_interval:
+            if now - last_pane_check >= pane_check_interval:
                 try:
                     alive = bool(backend.is_alive(pane_id))
                 except Exception:
@@ -631,32 +769,38 @@ class ClaudeAdapter(BaseProviderAdapter):
                         fallback_scan=fallback_scan,
                         anchor_ms=anchor_ms,
                     )
-                last_pane_check = time.time()
+                last_pane_check = now
 
             events, state = log_reader.wait_for_events(state, wait_step)
+            now = clock()
             if not events:
-                if (not rebounded) and (not anchor_seen) and time.time() >= anchor_grace_deadline:
-                    log_reader = ClaudeLogReader(work_dir=Path(session.work_dir), use_sessions_index=False)
+                if (not rebounded) and (not anchor_seen) and now >= anchor_grace_deadline:
+                    log_reader.rebind(use_sessions_index=False)
                     log_hint = log_reader.current_session_path()
                     state = _tail_state_for_log(log_hint, tail_bytes=tail_bytes)
+                    if log_watch is not None:
+                        log_watch.follow(log_reader, log_hint)
                     fallback_scan = True
                     rebounded = True
                 continue
 
             for role, text in events:
                 if role == "user":
-                    if f"{REQ_ID_PREFIX} {task.req_id}" in text:
+                    if anchor_needle in text:
                         anchor_seen = True
                         if anchor_ms is None:
                             anchor_ms = _now_ms() - started_ms
                     continue
                 if role != "assistant":
                     continue
-                if (not anchor_seen) and time.time() < anchor_collect_grace:
+                if (not anchor_seen) and now < anchor_collect_grace:
                     continue
                 chunks.append(text)
-                combined = "\n".join(chunks)
-                if is_done_text(combined, task.req_id):
+                # Chunks are joined on newlines, so the last non-trailer line of the joined text
+                # lives in the newest chunk unless that chunk is all trailers, in which case the
+                # earlier chunks were already checked and found not done. Checking just `text`
+                # is therefore equivalent to rescanning "\n".join(chunks).
+                if is_done_text(text, task.req_id):
                     done_seen = True
                     done_ms = _now_ms() - started_ms
                     break
@@ -6,6 +6,7 @@ Wraps existing caskd_* modules to provide a consistent interface.
 from __future__ import annotations
 
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Any, Optional
@@ -17,6 +18,7 @@ from caskd_session import CodexProjectSession, compute_session_key, load_project
 from codex_comm import CodexLogReader
 from completion_hook import notify_completion
 from providers import CASKD_SPEC
+from session_file_watcher import get_shared_watcher
 from terminal import get_backend_for_session, is_windows
 
 
@@ -39,6 +41,25 @@ def _tail_state_for_log(log_path_val: Optional[Path], *, tail_bytes: int) -> dic
     return {"log_path": log_path_val, "offset": offset}
 
 
+def _watch_log(reader: CodexLogReader, state: dict) -> Optional[tuple[Path, threading.Event]]:
+    """Wake reader's blocking reads on changes in the bound log's directory (needs watchdog)."""
+    log_path_val = state.get("log_path")
+    if not log_path_val:
+        return None
+    log_dir = Path(log_path_val).parent
+    if not log_dir.is_dir():
+        return None
+    change_event = threading.Event()
+    try:
+        if not get_shared_watcher().subscribe(log_dir, change_event):
+            return None
+    except Exception as exc:
+        _write_log(f"[WARN] codex log watcher start failed dir={log_dir}: {exc}")
+        return None
+    reader.set_change_event(change_event)
+    return log_dir, change_event
+
+
 class CodexAdapter(BaseProviderAdapter):
     """Adapter for Codex (WezTerm) provider."""
 
@@ -121,78 +142,86 @@ class CodexAdapter(BaseProviderAdapter):
         anchor_grace_deadline = min(deadline, time.time() + 1.5) if deadline else (time.time() + 1.5)
         anchor_collect_grace = min(deadline, time.time() + 2.0) if deadline else (time.time() + 2.0)
         rebounded = False
+        anchor_needle = f"{REQ_ID_PREFIX} {task.req_id}"
         tail_bytes = int(os.environ.get("CCB_CASKD_REBIND_TAIL_BYTES", str(2 * 1024 * 1024)))
         last_pane_check = time.time()
         default_interval = "5.0" if is_windows() else "2.0"
         pane_check_interval = float(os.environ.get("CCB_CASKD_PANE_CHECK_INTERVAL", default_interval))
 
-        while True:
-            if deadline is not None:
-                remaining = deadline - time.time()
-                if remaining <= 0:
-                    break
-                wait_step = min(remaining, 0.5)
-            else:
-                wait_step = 0.5
-
-            if time.time() - last_pane_check >= pane_check_interval:
-                try:
-                    alive = bool(backend.is_alive(pane_id))
-                except Exception:
-                    alive = False
-                if not alive:
-                    _write_log(f"[ERROR] Pane {pane_id} died during request req_id={task.req_id}")
-                    codex_log_path = None
+        watch = _watch_log(reader, state)
+        try:
+            while True:
+                if deadline is not None:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    wait_step = min(remaining, 0.5)
+                else:
+                    wait_step = 0.5
+
+                if time.time() - last_pane_check >= pane_check_interval:
                     try:
-                        lp = reader.current_log_path()
-                        if lp:
-                            codex_log_path = str(lp)
+                        alive = bool(backend.is_alive(pane_id))
                     except Exception:
-                        pass
-                    return ProviderResult(
-                        exit_code=1,
-                        reply="Codex pane died during request",
-                        req_id=task.req_id,
-                        session_key=session_key,
-                        done_seen=False,
-                        anchor_seen=anchor_seen,
-                        fallback_scan=fallback_scan,
-                        anchor_ms=anchor_ms,
-                        log_path=codex_log_path,
-                    )
-                last_pane_check = time.time()
-
-            event, state = reader.wait_for_event(state, wait_step)
-            if event is None:
-                if (not rebounded) and (not anchor_seen) and time.time() >= anchor_grace_deadline and codex_session_id:
-                    codex_session_id = None
-                    reader = CodexLogReader(log_path=preferred_log, session_id_filter=None, work_dir=Path(session.work_dir))
-                    log_hint = reader.current_log_path()
-                    state = _tail_state_for_log(log_hint, tail_bytes=tail_bytes)
-                    fallback_scan = True
-                    rebounded = True
-                continue
-
-            role, text = event
-            if role == "user":
-                if f"{REQ_ID_PREFIX} {task.req_id}" in text:
-                    anchor_seen = True
-                    if anchor_ms is None:
-                        anchor_ms = _now_ms() - started_ms
-                continue
-
-            if role != "assistant":
-                continue
-
-            if (not anchor_seen) and time.time() < anchor_collect_grace:
-                continue
-
-            chunks.append(text)
-            combined = "\n".join(chunks)
-            if is_done_text(combined, task.req_id):
-                done_seen = True
-                done_ms = _now_ms() - started_ms
-                break
+                        alive = False
+                    if not alive:
+                        _write_log(f"[ERROR] Pane {pane_id} died during request req_id={task.req_id}")
+                        codex_log_path = None
+                        try:
+                            lp = reader.current_log_path()
+                            if lp:
+                                codex_log_path = str(lp)
+                        except Exception:
+                            pass
+                        return ProviderResult(
+                            exit_code=1,
+                            reply="Codex pane died during request",
+                            req_id=task.req_id,
+                            session_key=session_key,
+                            done_seen=False,
+                            anchor_seen=anchor_seen,
+                            fallback_scan=fallback_scan,
+                            anchor_ms=anchor_ms,
+                            log_path=codex_log_path,
+                        )
+                    last_pane_check = time.time()
+
+                event, state = reader.wait_for_event(state, wait_step)
+                if event is None:
+                    if (not rebounded) and (not anchor_seen) and time.time() >= anchor_grace_deadline and codex_session_id:
+                        codex_session_id = None
+                        change_event = reader.change_event
+                        reader = CodexLogReader(log_path=preferred_log, session_id_filter=None, work_dir=Path(session.work_dir))
+                        reader.set_change_event(change_event)
+                        log_hint = reader.current_log_path()
+                        state = _tail_state_for_log(log_hint, tail_bytes=tail_bytes)
+                        fallback_scan = True
+                        rebounded = True
+                    continue
+
+                role, text = event
+                if role == "user":
+                    if anchor_needle in text:
+                        anchor_seen = True
+                        if anchor_ms is None:
+                            anchor_ms = _now_ms() - started_ms
+                    continue
+
+                if role != "assistant":
+                    continue
+
+                if (not anchor_seen) and time.time() < anchor_collect_grace:
+                    continue
+
+                chunks.append(text)
+                # Earlier chunks were already checked, so only the newest one can complete the reply.
+                if is_done_text(text, task.req_id):
+                    done_seen = True
+                    done_ms = _now_ms() - started_ms
+                    break
+        finally:
+            if watch is not None:
+                get_shared_watcher().unsubscribe(*watch)
 
         combined = "\n".join(chunks)
         reply = strip_done_text(combined, task.req_id)
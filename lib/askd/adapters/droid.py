@@ -124,6 +124,7 @@ class DroidAdapter(BaseProviderAdapter):
         anchor_grace_deadline = min(deadline, time.time() + 1.5) if deadline else (time.time() + 1.5)
         anchor_collect_grace = min(deadline, time.time() + 2.0) if deadline else (time.time() + 2.0)
         rebounded = False
+        anchor_needle = f"{REQ_ID_PREFIX} {task.req_id}"
         tail_bytes = int(os.environ.get("CCB_DASKD_REBIND_TAIL_BYTES", str(2 * 1024 * 1024)))
         pane_check_interval = float(os.environ.get("CCB_DASKD_PANE_CHECK_INTERVAL", "2.0"))
         last_pane_check = time.time()
@@ -168,7 +169,7 @@ class DroidAdapter(BaseProviderAdapter):
 
             for role, text in events:
                 if role == "user":
-                    if f"{REQ_ID_PREFIX} {task.req_id}" in text:
+                    if anchor_needle in text:
                         anchor_seen = True
                         if anchor_ms is None:
                             anchor_ms = _now_ms() - started_ms
@@ -178,8 +179,8 @@ class DroidAdapter(BaseProviderAdapter):
                 if (not anchor_seen) and time.time() < anchor_collect_grace:
                     continue
                 chunks.append(text)
-                combined = "\n".join(chunks)
-                if is_done_text(combined, task.req_id):
+                # Earlier chunks were already checked, so only the newest one can complete the reply.
+                if is_done_text(text, task.req_id):
                     done_seen = True
                     done_ms = _now_ms() - started_ms
                     break
@@ -192,8 +192,8 @@ class OpenCodeAdapter(BaseProviderAdapter):
             if not reply:
                 continue
             chunks.append(reply)
-            combined = "\n".join(chunks)
-            if is_done_text(combined, task.req_id):
+            # Earlier chunks were already checked, so only the newest one can complete the reply.
+            if is_done_text(reply, task.req_id):
                 done_seen = True
                 done_ms = _now_ms() - started_ms
                 break
@@ -9,6 +9,7 @@ import time
 from pathlib import Path
 from typing import Callable, Optional
 
+import json_fast
 from askd_runtime import log_path, normalize_connect_host, run_dir, write_log
 from process_lock import ProviderLock
 from providers import ProviderDaemonSpec
@@ -146,7 +147,8 @@ class AskDaemonServer:
 
             def _write(self, obj: dict) -> None:
                 try:
-                    data = (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+                    # Replies can be many KB of non-ASCII markdown; orjson encodes them far faster.
+                    data = (json_fast.dumps(obj) + "\n").encode("utf-8")
                     self.wfile.write(data)
                     self.wfile.flush()
                     try:
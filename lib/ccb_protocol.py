@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import re
 import secrets
 from dataclasses import dataclass
@@ -69,8 +70,19 @@ def wrap_codex_prompt(message: str, req_id: str) -> str:
     )
 
 
-def done_line_re(req_id: str) -> re.Pattern[str]:
-    return re.compile(DONE_LINE_RE_TEMPLATE.format(req_id=re.escape(req_id)))
+@functools.lru_cache(maxsize=256)
+def done_line_re(req_id: str, ignore_case: bool = False) -> re.Pattern[str]:
+    # Bounded: long-lived daemons see an unbounded stream of req_ids.
+    flags = re.IGNORECASE if ignore_case else 0
+    return re.compile(DONE_LINE_RE_TEMPLATE.format(req_id=re.escape(req_id)), flags)
+
+
+def _is_done_line(line: str, req_id: str) -> bool:
+    # Literal equivalent of done_line_re(req_id).match(line); avoids compiling a pattern per req_id.
+    stripped = (line or "").strip()
+    if not stripped.startswith(DONE_PREFIX):
+        return False
+    return stripped[len(DONE_PREFIX):].strip() == req_id
 
 
 def is_done_text(text: str, req_id: str) -> bool:
@@ -78,7 +90,7 @@ def is_done_text(text: str, req_id: str) -> bool:
     for i in range(len(lines) - 1, -1, -1):
         if _is_trailing_noise_line(lines[i]):
             continue
-        return bool(done_line_re(req_id).match(lines[i]))
+        return _is_done_line(lines[i], req_id)
     return False
 
 
@@ -90,7 +102,7 @@ def strip_done_text(text: str, req_id: str) -> str:
     while lines and _is_trailing_noise_line(lines[-1]):
         lines.pop()
 
-    if lines and done_line_re(req_id).match(lines[-1] or ""):
+    if lines and _is_done_line(lines[-1], req_id):
         lines.pop()
 
     while lines and _is_trailing_noise_line(lines[-1]):
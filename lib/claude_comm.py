@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
@@ -180,6 +181,62 @@ def _extract_message(entry: dict, role: str) -> Optional[str]:
     return _extract_content_text(entry.get("content"))
 
 
+def _read_appended(path: Path, offset: int) -> Optional[Tuple[int, bytes]]:
+    """
+    Read the bytes appended to `path` since `offset`.
+
+    Returns (start_offset, data), or None if the file cannot be read. A file that shrank below
+    `offset` is treated as rewritten and read from 0. An unchanged file costs a single stat().
+    """
+    try:
+        size = os.stat(path).st_size
+    except OSError:
+        return None
+    if size < offset:
+        offset = 0
+    if size == offset:
+        return offset, b""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return None
+    try:
+        if hasattr(os, "pread"):
+            data = os.pread(fd, size - offset, offset)
+        else:
+            os.lseek(fd, offset, os.SEEK_SET)
+            data = os.read(fd, size - offset)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+    return offset, data
+
+
+# Every entry _extract_message accepts carries its role as a JSON string value, so raw lines
+# without one of these (summaries, file snapshots, ...) can be skipped before decoding.
+_ASSISTANT_ROLE_NEEDLES = (b'"assistant"',)
+_MESSAGE_ROLE_NEEDLES = (b'"user"', b'"assistant"')
+
+
+def _mentions_role(line: bytes, needles: tuple[bytes, ...]) -> bool:
+    low = line.lower()
+    return any(needle in low for needle in needles)
+
+
+def _split_complete_lines(carry: bytes, data: bytes) -> Tuple[list[bytes], bytes]:
+    """Split appended log bytes into stripped non-blank complete lines and the trailing partial line."""
+    # Split `data` alone and glue the carry onto its first line, so a pending partial line
+    # never forces a copy of the whole appended chunk.
+    parts = data.split(b"\n")
+    tail = parts.pop()
+    if not parts:
+        return [], carry + tail
+    if carry:
+        parts[0] = carry + parts[0]
+    return [line for line in (raw.strip() for raw in parts) if line], tail
+
+
 class ClaudeLogReader:
     """Reads Claude session logs from ~/.claude/projects/<key>"""
 
@@ -205,6 +262,8 @@ class ClaudeLogReader:
         except Exception:
             poll = 0.05
         self._poll_interval = min(0.5, max(0.02, poll))
+        self._change_event: Optional[threading.Event] = None
+        self._watched_dir: Optional[Path] = None
 
     def _project_dir(self) -> Path:
         candidates = _candidate_project_dirs(self.root, self.work_dir)
@@ -380,10 +439,49 @@ class ClaudeLogReader:
     def current_session_path(self) -> Optional[Path]:
         return self._latest_session()
 
+    def rebind(self, *, use_sessions_index: bool) -> None:
+        """Forget the preferred session and re-resolve it on the next read, optionally ignoring sessions-index.json."""
+        self._use_sessions_index = bool(use_sessions_index)
+        self._preferred_session = None
+
+    @property
+    def change_event(self) -> Optional[threading.Event]:
+        return self._change_event
+
+    def set_change_event(self, event: Optional[threading.Event], *, watched_dir: Optional[Path] = None) -> None:
+        """
+        Let a file watcher wake blocking reads.
+
+        `watched_dir` is the directory the watcher covers (non-recursively); the watcher should set
+        `event` whenever a file there changes. While the log being read is in that directory, blocking
+        reads wait on `event` until their deadline; otherwise (another project dir after a rebind, or
+        subagent logs in a subdirectory) they still wake every poll interval.
+        """
+        self._change_event = event
+        self._watched_dir = Path(watched_dir) if (event is not None and watched_dir) else None
+
+    def watches_session(self, session: Optional[Path]) -> bool:
+        """True when the change event is set for every write a read of `session` consumes."""
+        if self._change_event is None or self._watched_dir is None or session is None:
+            return False
+        return (not self._include_subagents) and Path(session).parent == self._watched_dir
+
+    def _wait_for_change(self, deadline: float, session: Optional[Path]) -> None:
+        event = self._change_event
+        if event is None:
+            time.sleep(self._poll_interval)
+            return
+        timeout = max(0.0, deadline - time.time())
+        if not self.watches_session(session):
+            timeout = min(timeout, self._poll_interval)
+        if event.wait(timeout):
+            # Clear before the caller re-reads so a write racing with the read re-arms the wait.
+            event.clear()
+
     def capture_state(self) -> Dict[str, Any]:
         session = self._latest_session()
         offset = 0
-        if session and session.exists():
+        if session:
             try:
                 offset = session.stat().st_size
             except OSError:
@@ -464,7 +562,7 @@ class ClaudeLogReader:
             if session is None or not session.exists():
                 if not block or time.time() >= deadline:
                     return None, current_state
-                time.sleep(self._poll_interval)
+                self._wait_for_change(deadline, session)
                 continue
 
             if current_state.get("session_path") != session:
@@ -478,39 +576,24 @@ class ClaudeLogReader:
 
             if not block or time.time() >= deadline:
                 return None, current_state
-            time.sleep(self._poll_interval)
+            self._wait_for_change(deadline, session)
 
     def _read_new_messages(self, session: Path, state: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
         offset = int(state.get("offset") or 0)
         carry = state.get("carry") or b""
-        try:
-            size = session.stat().st_size
-        except OSError:
+        appended = _read_appended(session, offset)
+        if appended is None:
             return None, state
-
-        if size < offset:
-            offset = 0
+        start, data = appended
+        if start < offset:
             carry = b""
 
-        try:
-            with session.open("rb") as handle:
-                handle.seek(offset)
-                data = handle.read()
-        except OSError:
-            return None, state
-
-        new_offset = offset + len(data)
-        buf = carry + data
-        lines = buf.split(b"\n")
-        if buf and not buf.endswith(b"\n"):
-            carry = lines.pop()
-        else:
-            carry = b""
+        new_offset = start + len(data)
+        lines, carry = _split_complete_lines(carry, data)
 
         latest: Optional[str] = None
-        for raw in lines:
-            line = raw.strip()
-            if not line:
+        for line in lines:
+            if not _mentions_role(line, _ASSISTANT_ROLE_NEEDLES):
                 continue
             try:
                 entry = json.loads(line.decode("utf-8", errors="replace"))
@@ -532,7 +615,7 @@ class ClaudeLogReader:
             if session is None or not session.exists():
                 if not block or time.time() >= deadline:
                     return [], current_state
-                time.sleep(self._poll_interval)
+                self._wait_for_change(deadline, session)
                 continue
 
             if current_state.get("session_path") != session:
@@ -554,39 +637,24 @@ class ClaudeLogReader:
 
             if not block or time.time() >= deadline:
                 return [], current_state
-            time.sleep(self._poll_interval)
+            self._wait_for_change(deadline, session)
 
     def _read_new_events(self, session: Path, state: Dict[str, Any]) -> Tuple[list[tuple[str, str]], Dict[str, Any]]:
         offset = int(state.get("offset") or 0)
         carry = state.get("carry") or b""
-        try:
-            size = session.stat().st_size
-        except OSError:
+        appended = _read_appended(session, offset)
+        if appended is None:
             return [], state
-
-        if size < offset:
-            offset = 0
+        start, data = appended
+        if start < offset:
             carry = b""
 
-        try:
-            with session.open("rb") as handle:
-                handle.seek(offset)
-                data = handle.read()
-        except OSError:
-            return [], state
-
-        new_offset = offset + len(data)
-        buf = carry + data
-        lines = buf.split(b"\n")
-        if buf and not buf.endswith(b"\n"):
-            carry = lines.pop()
-        else:
-            carry = b""
+        new_offset = start + len(data)
+        lines, carry = _split_complete_lines(carry, data)
 
         events: list[tuple[str, str]] = []
-        for raw in lines:
-            line = raw.strip()
-            if not line:
+        for line in lines:
+            if not _mentions_role(line, _MESSAGE_ROLE_NEEDLES):
                 continue
             try:
                 entry = json.loads(line.decode("utf-8", errors="replace"))
@@ -668,34 +736,19 @@ class ClaudeLogReader:
     def _read_new_events_for_file(
         self, path: Path, offset: int, carry: bytes
     ) -> Tuple[list[tuple[str, str, dict]], Dict[str, Any]]:
-        try:
-            size = path.stat().st_size
-        except OSError:
+        appended = _read_appended(path, offset)
+        if appended is None:
             return [], {"offset": offset, "carry": carry}
-
-        if size < offset:
-            offset = 0
+        start, data = appended
+        if start < offset:
             carry = b""
 
-        try:
-            with path.open("rb") as handle:
-                handle.seek(offset)
-                data = handle.read()
-        except OSError:
-            return [], {"offset": offset, "carry": carry}
-
-        new_offset = offset + len(data)
-        buf = carry + data
-        lines = buf.split(b"\n")
-        if buf and not buf.endswith(b"\n"):
-            carry = lines.pop()
-        else:
-            carry = b""
+        new_offset = start + len(data)
+        lines, carry = _split_complete_lines(carry, data)
 
         events: list[tuple[str, str, dict]] = []
-        for raw in lines:
-            line = raw.strip()
-            if not line:
+        for line in lines:
+            if not _mentions_role(line, _MESSAGE_ROLE_NEEDLES):
                 continue
             try:
                 entry = json.loads(line.decode("utf-8", errors="replace"))
@@ -5,6 +5,7 @@ Sends requests via FIFO and parses replies from ~/.codex/sessions logs.
 
 from __future__ import annotations
 
+import itertools
 import json
 import os
 import re
@@ -14,7 +15,7 @@ import shlex
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any, List
+from typing import Optional, Tuple, Dict, Any, Callable, Iterator, List
 
 from terminal import get_backend_for_session, get_pane_id_from_session
 from ccb_config import apply_backend_env
@@ -22,6 +23,7 @@ from i18n import t
 from pane_registry import upsert_registry, registry_path_for_session, load_registry_by_session_id
 from session_utils import find_project_session_file
 from session_file_watcher import SessionFileWatcher, HAS_WATCHDOG
+import json_fast
 from project_id import compute_ccb_project_id
 
 apply_backend_env()
@@ -31,6 +33,18 @@ SESSION_ID_PATTERN = re.compile(
     r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
     re.IGNORECASE,
 )
+_SESSION_ID_BYTES_PATTERN = re.compile(SESSION_ID_PATTERN.pattern.encode("ascii"), re.IGNORECASE)
+# session_meta lines can carry long instructions; the id sits near the start.
+_SESSION_ID_PROBE_BYTES = 4096
+
+# session_meta cwd per log path; a log's first line never changes once written.
+_LOG_CWD_CACHE: Dict[str, Optional[str]] = {}
+_LOG_CWD_CACHE_MAX = 4096
+
+# Recent _scan_latest() results shared by every reader in the process, keyed by
+# (root, session id filter, work_dir) and stamped with time.monotonic().
+_SCAN_CACHE: Dict[Tuple[str, Optional[str], Optional[str]], Tuple[float, Optional[Path]]] = {}
+_SCAN_CACHE_MAX = 64
 
 _CODEX_WATCHER: Optional[SessionFileWatcher] = None
 _CODEX_WATCH_STARTED = False
@@ -48,6 +62,81 @@ def _env_float(name: str, default: float) -> float:
     return value
 
 
+def _may_hold_message(line: Any) -> bool:
+    """
+    Cheap substring prefilter run before json.loads on log lines.
+
+    Every entry the message/user/event extractors accept carries "message" or "assistant" in its
+    entry type, payload type or role, so lines without either (tool calls, reasoning, token counts)
+    cannot produce a result and are skipped unparsed.
+    """
+    if isinstance(line, bytes):
+        return b"message" in line or b"assistant" in line
+    return "message" in line or "assistant" in line
+
+
+_READ_BLOCK_BYTES = 64 * 1024
+_TAIL_BLOCK_BYTES = 64 * 1024
+
+
+def _read_next_entry(log_path: Path, offset: int, extract: Callable[[dict], Any]) -> Tuple[Any, int]:
+    """
+    Scan complete lines appended after `offset` until `extract` returns a result.
+
+    Returns (result or None, offset just past the consumed lines). A trailing line without a newline
+    is left for the next call since the writer may still be appending it. Reads use one fd and
+    block-sized preads instead of a buffered file object with per-line readline(). Raises OSError
+    if the log cannot be read.
+    """
+    fd = os.open(str(log_path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        pos = offset
+        carry = b""
+        while True:
+            if hasattr(os, "pread"):
+                data = os.pread(fd, _READ_BLOCK_BYTES, pos)
+            else:
+                os.lseek(fd, pos, os.SEEK_SET)
+                data = os.read(fd, _READ_BLOCK_BYTES)
+            if not data:
+                return None, offset
+            pos += len(data)
+            raw_lines = (carry + data).split(b"\n")
+            carry = raw_lines.pop()
+            for raw_line in raw_lines:
+                offset += len(raw_line) + 1
+                if not _may_hold_message(raw_line):
+                    continue
+                line = raw_line.decode("utf-8", errors="ignore").strip()
+                if not line:
+                    continue
+                try:
+                    entry = json_fast.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                result = extract(entry)
+                if result is not None:
+                    return result, offset
+    finally:
+        os.close(fd)
+
+
+def _iter_session_logs(root: str) -> Iterator[Tuple[str, float]]:
+    """Yield (path, mtime) for every *.jsonl under root, using scandir's cached entry type."""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_session_logs(entry.path)
+            elif entry.name.endswith(".jsonl") and entry.is_file():
+                yield entry.path, entry.stat().st_mtime
+        except OSError:
+            continue
+
+
 def _extract_cwd_from_log_file(log_path: Path) -> Optional[str]:
     try:
         with log_path.open("r", encoding="utf-8") as handle:
@@ -130,6 +219,9 @@ class CodexLogReader:
         except Exception:
             poll = 0.05
         self._poll_interval = min(0.5, max(0.01, poll))
+        self._change_event: Optional[threading.Event] = None
+        # Short-lived memo of _scan_latest() for _latest_log(); see _scan_latest_cached().
+        self._scan_ttl = max(0.0, _env_float("CODEX_SCAN_CACHE_TTL", 0.5))
 
     @staticmethod
     def _debug_enabled() -> bool:
@@ -155,53 +247,84 @@ class CodexLogReader:
         except ValueError:
             return default
 
-    def _iter_lines_reverse(self, log_path: Path, *, max_bytes: int, max_lines: int) -> List[str]:
+    def _iter_lines_reverse(self, log_path: Path, *, max_bytes: int, max_lines: int) -> Iterator[str]:
         """
-        Read lines from the end of a file (reverse order), bounded by max_bytes/max_lines.
-        Returns a list in reverse chronological order (last line first).
+        Yield lines from the end of a file (last line first), bounded by max_bytes/max_lines.
+
+        Lines are produced lazily block by block, so callers that stop at the first match only
+        read and decode the tail they need. Long lines are assembled once from their blocks
+        instead of re-concatenating a growing buffer per block.
         """
         if max_bytes <= 0 or max_lines <= 0:
-            return []
+            return
 
         try:
             with log_path.open("rb") as handle:
                 handle.seek(0, os.SEEK_END)
                 position = handle.tell()
                 bytes_read = 0
-                lines: List[str] = []
-                buffer = b""
+                emitted = 0
+                # Blocks of the (oldest, still incomplete) line being assembled, newest block first.
+                pending: List[bytes] = []
 
-                while position > 0 and bytes_read < max_bytes and len(lines) < max_lines:
-                    remaining = max_bytes - bytes_read
-                    read_size = min(8192, position, remaining)
+                while position > 0 and bytes_read < max_bytes and emitted < max_lines:
+                    read_size = min(_TAIL_BLOCK_BYTES, position, max_bytes - bytes_read)
                     position -= read_size
                     handle.seek(position, os.SEEK_SET)
                     chunk = handle.read(read_size)
                     bytes_read += len(chunk)
-                    buffer = chunk + buffer
+                    cut = chunk.rfind(b"\n")
+                    if cut < 0:
+                        pending.append(chunk)
+                        continue
 
-                    parts = buffer.split(b"\n")
-                    buffer = parts[0]
-                    for part in reversed(parts[1:]):
-                        if len(lines) >= max_lines:
-                            break
+                    pending.append(chunk[cut + 1:])
+                    parts = chunk[:cut].split(b"\n")
+                    completed = [b"".join(reversed(pending))]
+                    completed.extend(reversed(parts[1:]))
+                    pending = [parts[0]]
+                    for part in completed:
+                        if emitted >= max_lines:
+                            return
                         text = part.decode("utf-8", errors="ignore").strip()
                         if text:
-                            lines.append(text)
+                            emitted += 1
+                            yield text
 
-                if position == 0 and buffer and len(lines) < max_lines:
-                    text = buffer.decode("utf-8", errors="ignore").strip()
+                if position == 0 and emitted < max_lines:
+                    text = b"".join(reversed(pending)).decode("utf-8", errors="ignore").strip()
                     if text:
-                        lines.append(text)
-
-                return lines
+                        yield text
         except OSError as exc:
             self._debug(f"Failed reading log tail: {log_path} ({exc})")
-            return []
 
     def set_preferred_log(self, log_path: Optional[Path]) -> None:
         self._preferred_log = self._normalize_path(log_path)
 
+    @property
+    def change_event(self) -> Optional[threading.Event]:
+        return self._change_event
+
+    def set_change_event(self, event: Optional[threading.Event]) -> None:
+        """
+        Let a file watcher wake blocking reads.
+
+        When set, blocking reads wait on `event` until their next deadline or rescan instead of
+        sleeping one poll interval at a time; the watcher should set it whenever the log changes.
+        """
+        self._change_event = event
+
+    def _wait_for_change(self, until: float) -> None:
+        event = self._change_event
+        if event is None:
+            time.sleep(self._poll_interval)
+            return
+        if event.wait(max(0.0, until - time.time())):
+            # Clear before the caller re-reads so a write racing with the read re-arms the wait.
+            event.clear()
+            # The change may be a new log file; don't let a memoized scan hide it.
+            self.invalidate()
+
     def _normalize_work_dir(self, work_dir: Optional[Path]) -> Optional[str]:
         """Normalize work_dir for comparison with cwd in session logs"""
         if work_dir is None:
@@ -213,19 +336,30 @@ class CodexLogReader:
 
     def _extract_cwd_from_log(self, log_path: Path) -> Optional[str]:
         """Extract cwd from session_meta in the first line of log file"""
+        key = str(log_path)
+        if key in _LOG_CWD_CACHE:
+            return _LOG_CWD_CACHE[key]
         try:
             with log_path.open("r", encoding="utf-8") as f:
                 first_line = f.readline()
-            if not first_line:
-                return None
-            entry = json.loads(first_line)
-            if entry.get("type") == "session_meta":
-                cwd = entry.get("payload", {}).get("cwd")
-                if cwd:
-                    return str(Path(cwd).resolve()).lower()
+        except Exception:
+            return None
+        result: Optional[str] = None
+        try:
+            if first_line:
+                entry = json.loads(first_line)
+                if entry.get("type") == "session_meta":
+                    cwd = entry.get("payload", {}).get("cwd")
+                    if cwd:
+                        result = str(Path(cwd).resolve()).lower()
         except Exception:
             pass
-        return None
+        # Only cache once the first line is complete; a brand-new log may still be mid-write.
+        if first_line.endswith("\n"):
+            if len(_LOG_CWD_CACHE) >= _LOG_CWD_CACHE_MAX:
+                _LOG_CWD_CACHE.clear()
+            _LOG_CWD_CACHE[key] = result
+        return result
 
     def _normalize_path(self, value: Optional[Any]) -> Optional[Path]:
         if value in (None, ""):
@@ -240,32 +374,52 @@ class CodexLogReader:
     def _scan_latest(self) -> Optional[Path]:
         if not self.root.exists():
             return None
-        try:
-            # Avoid sorting the full list (can be slow on large histories / slow filesystems).
-            latest: Optional[Path] = None
-            latest_mtime = -1.0
-            for p in (p for p in self.root.glob("**/*.jsonl") if p.is_file()):
-                if self._session_id_filter:
-                    try:
-                        if str(self._session_id_filter).lower() not in str(p).lower():
-                            continue
-                    except Exception:
-                        pass
-                if self._work_dir:
-                    cwd = self._extract_cwd_from_log(p)
-                    if not cwd or cwd != self._work_dir:
-                        continue
-                try:
-                    mtime = p.stat().st_mtime
-                except OSError:
+        id_filter = str(self._session_id_filter).lower() if self._session_id_filter else None
+        candidates: List[Tuple[float, int, str]] = []
+        for p, mtime in _iter_session_logs(str(self.root)):
+            if id_filter and id_filter not in p.lower():
+                continue
+            candidates.append((mtime, len(candidates), p))
+
+        # Newest first (later scan order wins ties), so only the logs newer than the
+        # first work_dir match need their session_meta line read.
+        candidates.sort(reverse=True)
+        for _mtime, _order, p in candidates:
+            path = Path(p)
+            if self._work_dir:
+                cwd = self._extract_cwd_from_log(path)
+                if not cwd or cwd != self._work_dir:
                     continue
-                if mtime >= latest_mtime:
-                    latest = p
-                    latest_mtime = mtime
-        except OSError:
-            return None
+            return path
+        return None
+
+    def _scan_cache_key(self) -> Tuple[str, Optional[str], Optional[str]]:
+        id_filter = str(self._session_id_filter).lower() if self._session_id_filter else None
+        return str(self.root), id_filter, self._work_dir
 
-        return latest
+    def _scan_latest_cached(self) -> Optional[Path]:
+        """
+        _scan_latest(), reusing a result younger than CODEX_SCAN_CACHE_TTL seconds.
+
+        current_log_path()/capture_state() and friends are often called back to back, and askd builds
+        a fresh reader per task, so results are shared by all readers scanning the same root, filter
+        and work_dir. The incremental readers' periodic rescans still call _scan_latest() directly.
+        """
+        key = self._scan_cache_key()
+        now = time.monotonic()
+        cached = _SCAN_CACHE.get(key)
+        if cached is not None and now - cached[0] < self._scan_ttl:
+            return cached[1]
+        result = self._scan_latest()
+        if self._scan_ttl > 0:
+            if len(_SCAN_CACHE) >= _SCAN_CACHE_MAX:
+                _SCAN_CACHE.clear()
+            _SCAN_CACHE[key] = (now, result)
+        return result
+
+    def invalidate(self) -> None:
+        """Drop the memoized scan result (e.g. after a watcher reports a new log file)."""
+        _SCAN_CACHE.pop(self._scan_cache_key(), None)
 
     def _latest_log(self) -> Optional[Path]:
         preferred = self._preferred_log
@@ -276,7 +430,7 @@ class CodexLogReader:
                 return preferred
 
             # Otherwise, keep following the most recently updated log for this work dir.
-            latest = self._scan_latest()
+            latest = self._scan_latest_cached()
             if latest and latest != preferred:
                 try:
                     preferred_mtime = preferred.stat().st_mtime
@@ -293,7 +447,7 @@ class CodexLogReader:
             return preferred
 
         self._debug("No valid preferred log, scanning...")
-        latest = self._scan_latest()
+        latest = self._scan_latest_cached()
         if latest:
             self._preferred_log = latest
             self._debug(f"Scan found: {latest}")
@@ -307,9 +461,12 @@ class CodexLogReader:
         """Capture current log path and offset"""
         log = self._latest_log()
         offset = -1
+        ident = None
         if log and log.exists():
             try:
-                offset = log.stat().st_size
+                st = log.stat()
+                offset = st.st_size
+                ident = (st.st_dev, st.st_ino)
             except OSError:
                 try:
                     with log.open("rb") as handle:
@@ -317,7 +474,7 @@ class CodexLogReader:
                         offset = handle.tell()
                 except OSError:
                     offset = -1
-        return {"log_path": log, "offset": offset}
+        return {"log_path": log, "offset": offset, "ident": ident}
 
     def wait_for_message(self, state: Dict[str, Any], timeout: float) -> Tuple[Optional[str], Dict[str, Any]]:
         """Block and wait for new reply"""
@@ -349,14 +506,12 @@ class CodexLogReader:
         tail_bytes = self._env_int("CODEX_LOG_TAIL_BYTES", 1024 * 1024 * 8)
         tail_lines = self._env_int("CODEX_LOG_TAIL_LINES", 5000)
         lines = self._iter_lines_reverse(log_path, max_bytes=tail_bytes, max_lines=tail_lines)
-        if not lines:
-            return None
 
         for line in lines:
-            if not line.startswith("{"):
+            if not line.startswith("{") or not _may_hold_message(line):
                 continue
             try:
-                entry = json.loads(line)
+                entry = json_fast.loads(line)
             except json.JSONDecodeError:
                 continue
             message = self._extract_message(entry)
@@ -371,6 +526,8 @@ class CodexLogReader:
         offset = state.get("offset", -1)
         if not isinstance(offset, int):
             offset = -1
+        # (st_dev, st_ino) of the file `offset` refers to; None when unknown.
+        ident = state.get("ident")
         # Keep rescans infrequent; new messages usually append to the same log file.
         rescan_interval = min(2.0, max(0.2, timeout / 2.0))
         last_rescan = time.time()
@@ -399,71 +556,60 @@ class CodexLogReader:
                 continue
 
             try:
-                size = log_path.stat().st_size
+                st = log_path.stat()
             except OSError:
-                size = None
+                st = None
+            size = st.st_size if st is not None else None
+            if st is not None:
+                if ident is not None and (st.st_dev, st.st_ino) != ident:
+                    # A different file than the one the offset was taken from (rotated in place or
+                    # rebound); read it from the start like a newly discovered log.
+                    offset = 0
+                ident = (st.st_dev, st.st_ino)
 
             # If caller couldn't capture a baseline, establish it now (start from EOF).
             if offset < 0:
                 offset = size if isinstance(size, int) else 0
 
-            with log_path.open("rb") as fh:
+            if isinstance(size, int) and offset > size:
+                # Truncated and rewritten in place: the old offset means nothing now.
+                offset = 0
+            if not isinstance(size, int) or offset < size:
                 try:
-                    if isinstance(size, int) and offset > size:
-                        offset = size
-                    fh.seek(offset, os.SEEK_SET)
+                    message, offset = _read_next_entry(log_path, offset, self._extract_message)
                 except OSError:
-                    # If seek fails, reset to EOF and try again on next loop.
+                    # If the read fails, reset to EOF and try again on next loop.
                     offset = size if isinstance(size, int) else 0
                     if not block:
-                        return None, {"log_path": log_path, "offset": offset}
+                        return None, {"log_path": log_path, "offset": offset, "ident": ident}
                     time.sleep(self._poll_interval)
                     continue
-                while True:
-                    if block and time.time() >= deadline:
-                        return None, {"log_path": log_path, "offset": offset}
-                    pos_before = fh.tell()
-                    raw_line = fh.readline()
-                    if not raw_line:
-                        break
-                    # If we hit EOF without a newline, the writer may still be appending this line.
-                    if not raw_line.endswith(b"\n"):
-                        fh.seek(pos_before)
-                        break
-                    offset = fh.tell()
-                    line = raw_line.decode("utf-8", errors="ignore").strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    message = self._extract_message(entry)
-                    if message is not None:
-                        return message, {"log_path": log_path, "offset": offset}
+                if message is not None:
+                    return message, {"log_path": log_path, "offset": offset, "ident": ident}
 
             if time.time() - last_rescan >= rescan_interval:
                 latest = self._scan_latest()
                 if latest and latest != log_path:
                     current_path = latest
                     self._preferred_log = latest
+                    ident = None
                     # When switching to a new log file (session rotation / new session),
                     # start from the beginning to avoid missing a reply that was already written
                     # before we noticed the new file.
                     offset = 0
                     if not block:
-                        return None, {"log_path": current_path, "offset": offset}
+                        return None, {"log_path": current_path, "offset": offset, "ident": ident}
                     time.sleep(self._poll_interval)
                     last_rescan = time.time()
                     continue
                 last_rescan = time.time()
 
             if not block:
-                return None, {"log_path": log_path, "offset": offset}
+                return None, {"log_path": log_path, "offset": offset, "ident": ident}
 
-            time.sleep(self._poll_interval)
+            self._wait_for_change(min(deadline, last_rescan + rescan_interval))
             if time.time() >= deadline:
-                return None, {"log_path": log_path, "offset": offset}
+                return None, {"log_path": log_path, "offset": offset, "ident": ident}
 
     def _read_event_since(self, state: Dict[str, Any], timeout: float, block: bool) -> Tuple[Optional[Tuple[str, str]], Dict[str, Any]]:
         """
@@ -476,6 +622,8 @@ class CodexLogReader:
         offset = state.get("offset", -1)
         if not isinstance(offset, int):
             offset = -1
+        # (st_dev, st_ino) of the file `offset` refers to; None when unknown.
+        ident = state.get("ident")
         rescan_interval = min(2.0, max(0.2, timeout / 2.0))
         last_rescan = time.time()
 
@@ -505,65 +653,55 @@ class CodexLogReader:
                 continue
 
             try:
-                size = log_path.stat().st_size
+                st = log_path.stat()
             except OSError:
-                size = None
+                st = None
+            size = st.st_size if st is not None else None
+            if st is not None:
+                if ident is not None and (st.st_dev, st.st_ino) != ident:
+                    # A different file than the one the offset was taken from (rotated in place or
+                    # rebound); read it from the start like a newly discovered log.
+                    offset = 0
+                ident = (st.st_dev, st.st_ino)
 
             if offset < 0:
                 offset = size if isinstance(size, int) else 0
 
-            with log_path.open("rb") as fh:
+            if isinstance(size, int) and offset > size:
+                # Truncated and rewritten in place: the old offset means nothing now.
+                offset = 0
+            if not isinstance(size, int) or offset < size:
                 try:
-                    if isinstance(size, int) and offset > size:
-                        offset = size
-                    fh.seek(offset, os.SEEK_SET)
+                    event, offset = _read_next_entry(log_path, offset, self._extract_event)
                 except OSError:
                     offset = size if isinstance(size, int) else 0
                     if not block:
-                        return None, {"log_path": log_path, "offset": offset}
+                        return None, {"log_path": log_path, "offset": offset, "ident": ident}
                     time.sleep(self._poll_interval)
                     continue
-                while True:
-                    if block and time.time() >= deadline:
-                        return None, {"log_path": log_path, "offset": offset}
-                    pos_before = fh.tell()
-                    raw_line = fh.readline()
-                    if not raw_line:
-                        break
-                    if not raw_line.endswith(b"\n"):
-                        fh.seek(pos_before)
-                        break
-                    offset = fh.tell()
-                    line = raw_line.decode("utf-8", errors="ignore").strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    event = self._extract_event(entry)
-                    if event is not None:
-                        return event, {"log_path": log_path, "offset": offset}
+                if event is not None:
+                    return event, {"log_path": log_path, "offset": offset, "ident": ident}
 
             if time.time() - last_rescan >= rescan_interval:
                 latest = self._scan_latest()
                 if latest and latest != log_path:
                     current_path = latest
                     self._preferred_log = latest
+                    ident = None
                     offset = 0
                     if not block:
-                        return None, {"log_path": current_path, "offset": offset}
+                        return None, {"log_path": current_path, "offset": offset, "ident": ident}
                     time.sleep(self._poll_interval)
                     last_rescan = time.time()
                     continue
                 last_rescan = time.time()
 
             if not block:
-                return None, {"log_path": log_path, "offset": offset}
+                return None, {"log_path": log_path, "offset": offset, "ident": ident}
 
-            time.sleep(self._poll_interval)
+            self._wait_for_change(min(deadline, last_rescan + rescan_interval))
             if time.time() >= deadline:
-                return None, {"log_path": log_path, "offset": offset}
+                return None, {"log_path": log_path, "offset": offset, "ident": ident}
 
     @staticmethod
     def _extract_message(entry: dict) -> Optional[str]:
@@ -584,12 +722,17 @@ class CodexLogReader:
                         continue
                     if item.get("type") in ("output_text", "text"):
                         text = item.get("text")
-                        if isinstance(text, str) and text.strip():
-                            texts.append(text.strip())
+                        if isinstance(text, str):
+                            text = text.strip()
+                            if text:
+                                texts.append(text)
                 if texts:
-                    return "\n".join(texts).strip()
-            elif isinstance(content, str) and content.strip():
-                return content.strip()
+                    # Parts are already stripped and non-empty, so the joined text needs no strip.
+                    return "\n".join(texts)
+            elif isinstance(content, str):
+                content = content.strip()
+                if content:
+                    return content
 
             message = payload.get("message")
             if isinstance(message, str) and message.strip():
@@ -658,17 +801,15 @@ class CodexLogReader:
         tail_bytes = self._env_int("CODEX_LOG_CONV_TAIL_BYTES", 1024 * 1024 * 32)
         tail_lines = self._env_int("CODEX_LOG_CONV_TAIL_LINES", 20000)
         lines = self._iter_lines_reverse(log_path, max_bytes=tail_bytes, max_lines=tail_lines)
-        if not lines:
-            return []
 
         pairs_rev: List[Tuple[str, str]] = []
         pending_reply: Optional[str] = None
 
         for line in lines:
-            if not line.startswith("{"):
+            if not line.startswith("{") or not _may_hold_message(line):
                 continue
             try:
-                entry = json.loads(line)
+                entry = json_fast.loads(line)
             except json.JSONDecodeError:
                 continue
 
@@ -709,7 +850,12 @@ class CodexCommunicator:
 
         self.timeout = int(os.environ.get("CODEX_SYNC_TIMEOUT", "30"))
         self.marker_prefix = "ask"
+        # Markers are ask-<unix seconds>-<pid>-<n>; the counter keeps asks within one second distinct.
+        self._pid = os.getpid()
+        self._marker_counter = itertools.count()
         self.project_session_file = self.session_info.get("_session_file")
+        # ((st_mtime_ns, st_size), parsed data) of the project session file; see _load_project_data().
+        self._project_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
         self._pane_health_cache: Optional[Tuple[float, bool]] = None
         self._pane_health_ttl = max(0.0, _env_float("CCB_CODEX_PANE_HEALTH_TTL", 1.0))
 
@@ -943,13 +1089,13 @@ class CodexCommunicator:
             self._send_via_terminal(content)
         else:
             with open(self.input_fifo, "w", encoding="utf-8") as fifo:
-                fifo.write(json.dumps(message, ensure_ascii=False) + "\n")
+                fifo.write(json_fast.dumps(message) + "\n")
                 fifo.flush()
 
         return marker, state
 
     def _generate_marker(self) -> str:
-        return f"{self.marker_prefix}-{int(time.time())}-{os.getpid()}"
+        return f"{self.marker_prefix}-{int(time.time())}-{self._pid}-{next(self._marker_counter)}"
 
     def ask_async(self, question: str) -> bool:
         try:
@@ -1084,12 +1230,8 @@ class CodexCommunicator:
             return
 
         project_file = Path(self.project_session_file)
-        if not project_file.exists():
-            return
-        try:
-            with project_file.open("r", encoding="utf-8-sig") as handle:
-                data = json.load(handle)
-        except Exception:
+        data = self._load_project_data(project_file)
+        if data is None:
             return
 
         ccb_project_id = ""
@@ -1186,6 +1328,7 @@ class CodexCommunicator:
                 with tmp_file.open("w", encoding="utf-8") as handle:
                     json.dump(data, handle, ensure_ascii=False, indent=2)
                 os.replace(tmp_file, project_file)
+                self._cache_project_data(project_file, data)
             except PermissionError as e:
                 print(f"⚠️  Cannot update {project_file.name}: {e}", file=sys.stderr)
                 print(f"💡 Try: sudo chown $USER:$USER {project_file}", file=sys.stderr)
@@ -1228,6 +1371,38 @@ class CodexCommunicator:
         if resume_cmd:
             self.session_info["codex_start_cmd"] = resume_cmd
 
+    def _load_project_data(self, project_file: Path) -> Optional[Any]:
+        """
+        Parse the project session file, reusing the last parse while its (mtime, size) is unchanged.
+
+        Returns a shallow copy for dicts so callers can update keys without touching the cache.
+        """
+        try:
+            st = project_file.stat()
+        except OSError:
+            return None
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._project_cache
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
+        try:
+            with project_file.open("r", encoding="utf-8-sig") as handle:
+                data = json.load(handle)
+        except Exception:
+            return None
+        if not isinstance(data, dict):
+            return data
+        self._project_cache = (key, data)
+        return dict(data)
+
+    def _cache_project_data(self, project_file: Path, data: Dict[str, Any]) -> None:
+        try:
+            st = project_file.stat()
+        except OSError:
+            self._project_cache = None
+            return
+        self._project_cache = ((st.st_mtime_ns, st.st_size), dict(data))
+
     @staticmethod
     def _extract_session_id(log_path: Path) -> Optional[str]:
         for source in (log_path.stem, log_path.name):
@@ -1236,17 +1411,28 @@ class CodexCommunicator:
                 return match.group(0)
 
         try:
-            with log_path.open("r", encoding="utf-8") as handle:
-                first_line = handle.readline()
+            with log_path.open("rb") as handle:
+                head = handle.read(_SESSION_ID_PROBE_BYTES)
+                cut = head.find(b"\n")
+                # Probe the raw head of the first line before decoding (or reading) all of it.
+                match = _SESSION_ID_BYTES_PATTERN.search(head, 0, cut if cut >= 0 else len(head))
+                if match:
+                    return match.group(0).decode("ascii")
+                first_bytes = head[: cut + 1] if cut >= 0 else head + handle.readline()
         except OSError:
             return None
 
+        first_line = first_bytes.decode("utf-8", errors="replace")
         if not first_line:
             return None
 
         match = SESSION_ID_PATTERN.search(first_line)
         if match:
             return match.group(0)
+        # A UUID in a decoded value shows up verbatim in the raw line unless it was \u-escaped,
+        # so the JSON parse below can only find something the regex missed in that case.
+        if "\\u" not in first_line:
+            return None
 
         try:
             entry = json.loads(first_line)
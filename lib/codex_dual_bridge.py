@@ -6,16 +6,24 @@ Sends commands to Codex, supports tmux and WezTerm.
 from __future__ import annotations
 
 import argparse
-import json
+import itertools
 import os
+import selectors
 import signal
+import stat
 import time
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Optional, TextIO, Tuple
 
+import json_fast
 from terminal import TmuxBackend, WeztermBackend
 
+_FIFO_READ_BYTES = 64 * 1024
+# How often an idle bridge checks that its open FIFO is still the one at input_fifo.
+_FIFO_RECHECK_INTERVAL = 1.0
+
 
 def _env_float(name: str, default: float) -> float:
     raw = os.environ.get(name)
@@ -53,6 +61,20 @@ class DualBridge:
         self.history_file = self.history_dir / "session.jsonl"
         self.bridge_log = self.runtime_dir / "bridge.log"
         self.history_dir.mkdir(parents=True, exist_ok=True)
+        # Append handles stay open for the bridge's lifetime and are flushed once per request.
+        self._history_handle: Optional[TextIO] = None
+        self._bridge_log_handle: Optional[TextIO] = None
+        self._pid = os.getpid()
+        self._marker_counter = itertools.count()
+        # While run() is active the input FIFO stays open; run() blocks in the selector on it and on a
+        # self-pipe that the signal handler writes to, so shutdown does not wait for a request.
+        # These are opened by _open_wait_handles() and released by _close_wait_handles().
+        self._fifo_fd: Optional[int] = None
+        self._fifo_ident: Optional[Tuple[int, int]] = None
+        self._fifo_buffer = b""
+        self._pending_lines: Deque[bytes] = deque()
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_r = self._wake_w = -1
 
         terminal_type = os.environ.get("CODEX_TERMINAL", "tmux")
         pane_id = os.environ.get("CODEX_WEZTERM_PANE") if terminal_type == "wezterm" else os.environ.get("CODEX_TMUX_SESSION")
@@ -66,54 +88,170 @@ class DualBridge:
 
     def _handle_signal(self, signum: int, _: Any) -> None:
         self._running = False
+        self._wake()
         self._log_console(f"⚠️ Received signal {signum}, exiting...")
 
+    def _wake(self) -> None:
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
     def run(self) -> int:
         self._log_console("🔌 Codex bridge started, waiting for Claude commands...")
         idle_sleep = _env_float("CCB_BRIDGE_IDLE_SLEEP", 0.05)
         error_backoff_min = _env_float("CCB_BRIDGE_ERROR_BACKOFF_MIN", 0.05)
         error_backoff_max = _env_float("CCB_BRIDGE_ERROR_BACKOFF_MAX", 0.2)
         error_backoff = max(0.0, min(error_backoff_min, error_backoff_max))
-        while self._running:
-            try:
-                payload = self._read_request()
-                if payload is None:
-                    if idle_sleep:
-                        time.sleep(idle_sleep)
-                    continue
-                self._process_request(payload)
-                error_backoff = max(0.0, min(error_backoff_min, error_backoff_max))
-            except KeyboardInterrupt:
-                self._running = False
-            except Exception as exc:
-                self._log_console(f"❌ Failed to process message: {exc}")
-                self._log_bridge(f"error: {exc}")
-                if error_backoff:
-                    time.sleep(error_backoff)
-                if error_backoff_max:
-                    error_backoff = min(error_backoff_max, max(error_backoff_min, error_backoff * 2))
-
+        self._open_wait_handles()
+        try:
+            while self._running:
+                try:
+                    payload = self._read_request(idle_sleep)
+                    if payload is None:
+                        continue
+                    self._process_request(payload)
+                    self._flush_logs()
+                    error_backoff = max(0.0, min(error_backoff_min, error_backoff_max))
+                except KeyboardInterrupt:
+                    self._running = False
+                except Exception as exc:
+                    self._log_console(f"❌ Failed to process message: {exc}")
+                    self._log_bridge(f"error: {exc}")
+                    self._flush_logs()
+                    if error_backoff:
+                        time.sleep(error_backoff)
+                    if error_backoff_max:
+                        error_backoff = min(error_backoff_max, max(error_backoff_min, error_backoff * 2))
+        finally:
+            self._close_logs()
+            self._close_wait_handles()
         self._log_console("👋 Codex bridge exited")
         return 0
 
-    def _read_request(self) -> Optional[Dict[str, Any]]:
-        if not self.input_fifo.exists():
+    def _read_request(self, missing_fifo_wait: float) -> Optional[Dict[str, Any]]:
+        """
+        Return the next JSON request line from the input FIFO.
+
+        Blocks until a line arrives or _wake() is called; returns None on wake-up, on a line that is not
+        valid JSON, and after missing_fifo_wait seconds while the FIFO does not exist yet.
+        """
+        if not self._pending_lines:
+            self._wait_for_input(missing_fifo_wait)
+            if not self._pending_lines:
+                return None
+        line = self._pending_lines.popleft()
+        try:
+            return json_fast.loads(line)
+        except ValueError:
+            return None
+
+    def _wait_for_input(self, missing_fifo_wait: float) -> None:
+        selector = self._open_wait_handles()
+        fifo_fd = self._open_fifo()
+        timeout = _FIFO_RECHECK_INTERVAL if fifo_fd is not None else missing_fifo_wait
+        for key, _ in selector.select(timeout):
+            if key.fd == self._wake_r:
+                self._drain_wake()
+            elif key.fd == fifo_fd:
+                self._read_fifo(fifo_fd)
+
+    def _open_fifo(self) -> Optional[int]:
+        try:
+            st = self.input_fifo.stat()
+        except OSError:
+            self._close_fifo()
+            return None
+        ident = (st.st_dev, st.st_ino)
+        if self._fifo_fd is not None:
+            if ident == self._fifo_ident:
+                return self._fifo_fd
+            # The FIFO was recreated; writers now open the new one.
+            self._close_fifo()
+        if not stat.S_ISFIFO(st.st_mode):
             return None
         try:
-            with self.input_fifo.open("r", encoding="utf-8") as fifo:
-                line = fifo.readline()
-                if not line:
-                    return None
-                return json.loads(line)
-        except (OSError, json.JSONDecodeError):
+            # O_RDWR keeps a writer attached, so the FIFO never reports EOF between requests.
+            fd = os.open(str(self.input_fifo), os.O_RDWR | os.O_NONBLOCK)
+        except OSError:
             return None
+        self._fifo_fd = fd
+        self._fifo_ident = ident
+        self._open_wait_handles().register(fd, selectors.EVENT_READ)
+        return fd
+
+    def _read_fifo(self, fifo_fd: int) -> None:
+        try:
+            chunk = os.read(fifo_fd, _FIFO_READ_BYTES)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._close_fifo()
+            return
+        *lines, self._fifo_buffer = (self._fifo_buffer + chunk).split(b"\n")
+        self._pending_lines.extend(line for line in lines if line.strip())
+
+    def _drain_wake(self) -> None:
+        try:
+            while os.read(self._wake_r, 512):
+                pass
+        except OSError:
+            pass
+
+    def _close_fifo(self) -> None:
+        if self._fifo_fd is None:
+            return
+        try:
+            if self._selector is not None:
+                self._selector.unregister(self._fifo_fd)
+        except (KeyError, ValueError):
+            pass
+        try:
+            os.close(self._fifo_fd)
+        except OSError:
+            pass
+        self._fifo_fd = None
+        self._fifo_ident = None
+        self._fifo_buffer = b""
+
+    def _open_wait_handles(self) -> selectors.BaseSelector:
+        """Create the selector and wake pipe on first use; _close_wait_handles() releases them."""
+        if self._selector is not None:
+            return self._selector
+        selector = selectors.DefaultSelector()
+        try:
+            wake_r, wake_w = os.pipe()
+        except OSError:
+            selector.close()
+            raise
+        os.set_blocking(wake_r, False)
+        os.set_blocking(wake_w, False)
+        selector.register(wake_r, selectors.EVENT_READ)
+        self._selector = selector
+        self._wake_r, self._wake_w = wake_r, wake_w
+        return selector
+
+    def _close_wait_handles(self) -> None:
+        self._close_fifo()
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd < 0:
+                continue
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        # A late signal must not write into whatever file reuses these descriptor numbers.
+        self._wake_r = self._wake_w = -1
 
     def _process_request(self, payload: Dict[str, Any]) -> None:
         content = payload.get("content", "")
         marker = payload.get("marker") or self._generate_marker()
 
         timestamp = self._timestamp()
-        self._log_bridge(json.dumps({"marker": marker, "question": content, "time": timestamp}, ensure_ascii=False))
+        self._log_bridge(json_fast.dumps({"marker": marker, "question": content, "time": timestamp}))
         self._append_history("claude", content, marker)
 
         try:
@@ -131,26 +269,51 @@ class DualBridge:
             "content": content,
         }
         try:
-            with self.history_file.open("a", encoding="utf-8") as handle:
-                json.dump(entry, handle, ensure_ascii=False)
-                handle.write("\n")
+            if self._history_handle is None:
+                self._history_handle = self._open_append(self.history_file)
+            self._history_handle.write(json_fast.dumps(entry) + "\n")
         except Exception as exc:
             self._log_console(f"⚠️ Failed to write history: {exc}")
 
     def _log_bridge(self, message: str) -> None:
         try:
-            with self.bridge_log.open("a", encoding="utf-8") as handle:
-                handle.write(f"{self._timestamp()} {message}\n")
+            if self._bridge_log_handle is None:
+                self._bridge_log_handle = self._open_append(self.bridge_log)
+            self._bridge_log_handle.write(f"{self._timestamp()} {message}\n")
         except Exception:
             pass
 
+    @staticmethod
+    def _open_append(path: Path) -> TextIO:
+        return path.open("a", encoding="utf-8", buffering=64 * 1024)
+
+    def _flush_logs(self) -> None:
+        for handle in (self._history_handle, self._bridge_log_handle):
+            if handle is None:
+                continue
+            try:
+                handle.flush()
+            except Exception as exc:
+                self._log_console(f"⚠️ Failed to flush bridge logs: {exc}")
+
+    def _close_logs(self) -> None:
+        self._flush_logs()
+        for handle in (self._history_handle, self._bridge_log_handle):
+            if handle is None:
+                continue
+            try:
+                handle.close()
+            except Exception:
+                pass
+        self._history_handle = None
+        self._bridge_log_handle = None
+
     @staticmethod
     def _timestamp() -> str:
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    @staticmethod
-    def _generate_marker() -> str:
-        return f"ask-{int(time.time())}-{os.getpid()}"
+    def _generate_marker(self) -> str:
+        return f"ask-{int(time.time())}-{self._pid}-{next(self._marker_counter)}"
 
     @staticmethod
     def _log_console(message: str) -> None:
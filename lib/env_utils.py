@@ -23,3 +23,13 @@ def env_int(name: str, default: int) -> int:
         return int(raw.strip())
     except (ValueError, TypeError):
         return default
+
+
+def env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None or raw == "":
+        return default
+    try:
+        return float(raw.strip())
+    except (ValueError, TypeError):
+        return default
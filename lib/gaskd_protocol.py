@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from ccb_protocol import (
     DONE_PREFIX,
     REQ_ID_PREFIX,
+    done_line_re,
     is_done_text,
     make_req_id,
     strip_done_text,
@@ -41,18 +42,22 @@ def extract_reply_for_req(text: str, req_id: str) -> str:
         return ""
 
     # Find last done-line index for this req_id (may not be last line if the model misbehaves).
-    target_re = re.compile(rf"^\s*CCB_DONE:\s*{re.escape(req_id)}\s*$", re.IGNORECASE)
-    done_idxs = [i for i, ln in enumerate(lines) if ANY_DONE_LINE_RE.match(ln or "")]
-    target_idxs = [i for i in done_idxs if target_re.match(lines[i] or "")]
+    target_re = done_line_re(req_id, ignore_case=True)
+    # Scan backwards: the target is normally the last line, so this stops almost immediately.
+    target_i = None
+    for i in range(len(lines) - 1, -1, -1):
+        ln = lines[i]
+        if target_re.match(ln) and ANY_DONE_LINE_RE.match(ln):
+            target_i = i
+            break
 
-    if not target_idxs:
+    if target_i is None:
         # Fallback: keep existing behavior (strip only if the last line matches).
         return strip_done_text(text, req_id)
 
-    target_i = target_idxs[-1]
     prev_done_i = -1
-    for i in reversed(done_idxs):
-        if i < target_i:
+    for i in range(target_i - 1, -1, -1):
+        if ANY_DONE_LINE_RE.match(lines[i]):
             prev_done_i = i
             break
 
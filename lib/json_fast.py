@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore[assignment]
+    HAS_ORJSON = False
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    json.loads with an optional orjson fast path, for parsing log entries.
+
+    Anything orjson rejects is re-parsed with json.loads, so callers see the stdlib's errors.
+    One difference remains: orjson decodes integers wider than 64 bits as floats.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Compact one-line JSON with non-ASCII text kept as-is, for JSONL records and FIFO messages.
+
+    Uses orjson when available; anything it cannot encode (non-str keys, integers beyond 64 bits,
+    lone surrogates) goes through json.dumps with the same compact separators.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except (orjson.JSONEncodeError, UnicodeDecodeError):
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
@@ -3,14 +3,15 @@ from __future__ import annotations
 import os
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from worker_pool import BaseSessionWorker, PerSessionWorkerPool
 
 from claude_comm import ClaudeLogReader
 from ccb_protocol import REQ_ID_PREFIX
+from env_utils import env_bool, env_float, env_int
 from laskd_protocol import (
     LaskdRequest,
     LaskdResult,
@@ -24,6 +25,8 @@ from laskd_session import compute_session_key, load_project_session
 from laskd_registry import get_session_registry
 from pane_registry import upsert_registry
 from project_id import compute_ccb_project_id
+from session_file_watcher import get_shared_watcher
+from session_utils import find_project_session_file
 from terminal import get_backend_for_session
 from askd_runtime import state_file_path, log_path, write_log, random_token
 import askd_rpc
@@ -39,18 +42,77 @@ def _write_log(line: str) -> None:
     write_log(log_path(LASKD_SPEC.log_file_name), line)
 
 
-def _tail_state_for_log(log_path: Optional[Path], *, tail_bytes: int) -> dict:
-    if not log_path or not log_path.exists():
-        return {"session_path": log_path if log_path else None, "offset": 0, "carry": b""}
-    try:
-        size = log_path.stat().st_size
-    except OSError:
-        size = 0
+_REBIND_TAIL_BYTES = env_int("CCB_LASKD_REBIND_TAIL_BYTES", 2 * 1024 * 1024)
+_PANE_CHECK_INTERVAL_S = env_float("CCB_LASKD_PANE_CHECK_INTERVAL", 2.0)
+_COALESCE = env_bool("CCB_LASKD_COALESCE")
+
+
+def _tail_state_for_log(log_path: Optional[Path], *, tail_bytes: int, size: Optional[int] = None) -> dict:
+    if not log_path:
+        return {"session_path": None, "offset": 0, "carry": b""}
+    if size is None:
+        # A missing log stats as size 0, i.e. read it from the start once it appears.
+        try:
+            size = log_path.stat().st_size
+        except OSError:
+            size = 0
     offset = max(0, size - max(0, int(tail_bytes)))
     return {"session_path": log_path, "offset": offset, "carry": b""}
 
 
-@dataclass
+def _probe_pane(backend: Any, pane_id: str, *, lines: int) -> tuple[bool, Optional[str]]:
+    """Pane liveness plus its last `lines` lines, in one tmux round-trip when the backend has probe()."""
+    probe = getattr(backend, "probe", None)
+    if probe is not None:
+        try:
+            return probe(pane_id, lines=lines)
+        except Exception:
+            return False, None
+    try:
+        alive = bool(backend.is_alive(pane_id))
+    except Exception:
+        return False, None
+    if not alive or not hasattr(backend, "get_text"):
+        return alive, None
+    try:
+        return True, backend.get_text(pane_id, lines=lines)
+    except Exception:
+        return True, None
+
+
+def _watch_log(log_reader: ClaudeLogReader, state: dict) -> Optional[tuple[Path, threading.Event]]:
+    """Wake log_reader's blocking reads on changes in the session log's project dir (needs watchdog)."""
+    session_path = state.get("session_path")
+    if not session_path:
+        return None
+    project_dir = Path(session_path).parent
+    if not project_dir.is_dir():
+        return None
+    change_event = threading.Event()
+    try:
+        if not get_shared_watcher().subscribe(project_dir, change_event):
+            return None
+    except Exception as exc:
+        _write_log(f"[WARN] claude log watcher start failed dir={project_dir}: {exc}")
+        return None
+    log_reader.set_change_event(change_event, watched_dir=project_dir)
+    return project_dir, change_event
+
+
+def _rewatch_log(
+    log_reader: ClaudeLogReader, state: dict, watch: Optional[tuple[Path, threading.Event]]
+) -> Optional[tuple[Path, threading.Event]]:
+    """Move the watch to the project dir of the log state now points at (e.g. after a rebind)."""
+    session_path = state.get("session_path")
+    if watch is not None and session_path and Path(session_path).parent == watch[0]:
+        return watch
+    if watch is not None:
+        get_shared_watcher().unsubscribe(*watch)
+        log_reader.set_change_event(None)
+    return _watch_log(log_reader, state)
+
+
+@dataclass(slots=True)
 class _QueuedTask:
     request: LaskdRequest
     created_ms: int
@@ -60,20 +122,57 @@ class _QueuedTask:
 
 
 class _SessionWorker(BaseSessionWorker[_QueuedTask, LaskdResult]):
-    def _handle_exception(self, exc: Exception, task: _QueuedTask) -> LaskdResult:
-        _write_log(f"[ERROR] session={self.session_key} req_id={task.req_id} {exc}")
+    def _error(
+        self,
+        task: _QueuedTask,
+        reply: str,
+        *,
+        anchor_seen: bool = False,
+        fallback_scan: bool = False,
+        anchor_ms: int | None = None,
+    ) -> LaskdResult:
         return LaskdResult(
             exit_code=1,
-            reply=str(exc),
+            reply=reply,
             req_id=task.req_id,
             session_key=self.session_key,
             done_seen=False,
             done_ms=None,
-            anchor_seen=False,
-            fallback_scan=False,
-            anchor_ms=None,
+            anchor_seen=anchor_seen,
+            fallback_scan=fallback_scan,
+            anchor_ms=anchor_ms,
         )
 
+    def _coalesce_queued(self, task: _QueuedTask, result: LaskdResult) -> None:
+        """
+        Answer queued tasks that repeat task's message with its result (opt-in: CCB_LASKD_COALESCE=1).
+
+        Only completed replies are shared. Each coalesced task keeps its own req_id; it never sent an
+        anchor of its own, so its timings are reset and done_ms counts from when it was queued.
+        """
+        if not result.done_seen or not _COALESCE:
+            return
+        req = task.request
+        now_ms = _now_ms()
+        for queued in self.queued_tasks():
+            other = queued.request
+            if queued.done_event.is_set() or other.message != req.message or other.no_wrap != req.no_wrap:
+                continue
+            queued.result = replace(
+                result,
+                req_id=queued.req_id,
+                done_ms=max(0, now_ms - queued.created_ms),
+                anchor_seen=False,
+                anchor_ms=None,
+                fallback_scan=False,
+            )
+            queued.done_event.set()
+            _write_log(f"[INFO] coalesced session={self.session_key} req_id={queued.req_id} with={task.req_id}")
+
+    def _handle_exception(self, exc: Exception, task: _QueuedTask) -> LaskdResult:
+        _write_log(f"[ERROR] session={self.session_key} req_id={task.req_id} {exc}")
+        return self._error(task, str(exc))
+
     def _handle_task(self, task: _QueuedTask) -> LaskdResult:
         started_ms = _now_ms()
         req = task.request
@@ -82,46 +181,19 @@ class _SessionWorker(BaseSessionWorker[_QueuedTask, LaskdResult]):
 
         session = load_project_session(work_dir)
         if not session:
-            return LaskdResult(
-                exit_code=1,
-                reply="❌ No active Claude session found for work_dir. Run 'ccb claude' (or add claude to ccb.config) in that project first.",
-                req_id=task.req_id,
-                session_key=self.session_key,
-                done_seen=False,
-                done_ms=None,
-                anchor_seen=False,
-                fallback_scan=False,
-                anchor_ms=None,
+            return self._error(
+                task,
+                "❌ No active Claude session found for work_dir. Run 'ccb claude' (or add claude to ccb.config) in that project first.",
             )
 
         ok, pane_or_err = session.ensure_pane()
         if not ok:
-            return LaskdResult(
-                exit_code=1,
-                reply=f"❌ Session pane not available: {pane_or_err}",
-                req_id=task.req_id,
-                session_key=self.session_key,
-                done_seen=False,
-                done_ms=None,
-                anchor_seen=False,
-                fallback_scan=False,
-                anchor_ms=None,
-            )
+            return self._error(task, f"❌ Session pane not available: {pane_or_err}")
         pane_id = pane_or_err
 
         backend = get_backend_for_session(session.data)
         if not backend:
-            return LaskdResult(
-                exit_code=1,
-                reply="❌ Terminal backend not available",
-                req_id=task.req_id,
-                session_key=self.session_key,
-                done_seen=False,
-                done_ms=None,
-                anchor_seen=False,
-                fallback_scan=False,
-                anchor_ms=None,
-            )
+            return self._error(task, "❌ Terminal backend not available")
 
         log_reader = ClaudeLogReader(work_dir=Path(session.work_dir))
         if session.claude_session_path:
@@ -137,104 +209,104 @@ class _SessionWorker(BaseSessionWorker[_QueuedTask, LaskdResult]):
             prompt = wrap_claude_prompt(req.message, task.req_id)
         backend.send_text(pane_id, prompt)
 
-        deadline = None if float(req.timeout_s) < 0.0 else (time.time() + float(req.timeout_s))
+        # Deadlines here are time.monotonic() values; read the clock once per loop step.
+        clock = time.monotonic
+        now = clock()
+        deadline = None if float(req.timeout_s) < 0.0 else (now + float(req.timeout_s))
         chunks: list[str] = []
         anchor_seen = False
         fallback_scan = False
         anchor_ms: int | None = None
         done_seen = False
         done_ms: int | None = None
-        anchor_grace_deadline = min(deadline, time.time() + 1.5) if deadline is not None else (time.time() + 1.5)
-        anchor_collect_grace = min(deadline, time.time() + 2.0) if deadline is not None else (time.time() + 2.0)
+        anchor_grace_deadline = min(deadline, now + 1.5) if deadline is not None else (now + 1.5)
+        anchor_collect_grace = min(deadline, now + 2.0) if deadline is not None else (now + 2.0)
         rebounded = False
-        tail_bytes = int(os.environ.get("CCB_LASKD_REBIND_TAIL_BYTES", str(1024 * 1024 * 2)) or (1024 * 1024 * 2))
+        anchor_needle = f"{REQ_ID_PREFIX} {task.req_id}"
+        tail_bytes = _REBIND_TAIL_BYTES
 
-        pane_check_interval = float(os.environ.get("CCB_LASKD_PANE_CHECK_INTERVAL", "2.0") or "2.0")
-        last_pane_check = time.time()
+        pane_check_interval = _PANE_CHECK_INTERVAL_S
+        last_pane_check = now
+        last_event_at = now
 
-        while True:
-            if deadline is not None:
-                remaining = deadline - time.time()
-                if remaining <= 0:
-                    break
-                wait_step = min(remaining, 0.5)
-            else:
-                wait_step = 0.5
-
-            if time.time() - last_pane_check >= pane_check_interval:
-                try:
-                    alive = bool(backend.is_alive(pane_id))
-                except Exception:
-                    alive = False
-                if not alive:
-                    _write_log(f"[ERROR] Pane {pane_id} died during request session={self.session_key} req_id={task.req_id}")
-                    return LaskdResult(
-                        exit_code=1,
-                        reply="❌ Claude pane died during request",
-                        req_id=task.req_id,
-                        session_key=self.session_key,
-                        done_seen=False,
-                        done_ms=None,
-                        anchor_seen=anchor_seen,
-                        fallback_scan=fallback_scan,
-                        anchor_ms=anchor_ms,
-                    )
-
-                if hasattr(backend, "get_text"):
-                    try:
-                        pane_text = backend.get_text(pane_id, lines=15)
-                        if pane_text and "■ Conversation interrupted" in pane_text:
-                            req_id_pos = pane_text.find(task.req_id)
-                            interrupt_pos = pane_text.find("■ Conversation interrupted")
-                            is_current = (req_id_pos >= 0 and interrupt_pos > req_id_pos) or (
-                                req_id_pos < 0 and interrupt_pos >= 0
+        # Blocking reads wait on watcher events when watchdog is available, else they poll.
+        watch = _watch_log(log_reader, state)
+        try:
+            while True:
+                now = clock()
+                # Poll fast while waiting for the anchor. After that, back off as the log goes quiet,
+                # but only while the watcher covers the log (otherwise the wait step is the poll
+                # cadence), and never past the next pane check.
+                if (not anchor_seen) and now < anchor_grace_deadline:
+                    wait_step = min(0.05, anchor_grace_deadline - now)
+                elif log_reader.watches_session(state.get("session_path")):
+                    wait_step = min(1.0, max(0.02, 2.0 * (now - last_event_at)))
+                    wait_step = min(wait_step, max(0.02, last_pane_check + pane_check_interval - now))
+                else:
+                    wait_step = 0.5
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        break
+                    wait_step = min(remaining, wait_step)
+
+                if now - last_pane_check >= pane_check_interval:
+                    alive, pane_text = _probe_pane(backend, pane_id, lines=15)
+                    if not alive:
+                        _write_log(f"[ERROR] Pane {pane_id} died during request session={self.session_key} req_id={task.req_id}")
+                        return self._error(
+                            task, "❌ Claude pane died during request", anchor_seen=anchor_seen, fallback_scan=fallback_scan, anchor_ms=anchor_ms
+                        )
+
+                    if pane_text and "■ Conversation interrupted" in pane_text:
+                        req_id_pos = pane_text.find(task.req_id)
+                        interrupt_pos = pane_text.find("■ Conversation interrupted")
+                        is_current = (req_id_pos >= 0 and interrupt_pos > req_id_pos) or (
+                            req_id_pos < 0 and interrupt_pos >= 0
+                        )
+                        if is_current:
+                            return self._error(
+                                task, "❌ Claude interrupted", anchor_seen=anchor_seen, fallback_scan=fallback_scan, anchor_ms=anchor_ms
                             )
-                            if is_current:
-                                return LaskdResult(
-                                    exit_code=1,
-                                    reply="❌ Claude interrupted",
-                                    req_id=task.req_id,
-                                    session_key=self.session_key,
-                                    done_seen=False,
-                                    done_ms=None,
-                                    anchor_seen=anchor_seen,
-                                    fallback_scan=fallback_scan,
-                                    anchor_ms=anchor_ms,
-                                )
-                    except Exception:
-                        pass
-                last_pane_check = time.time()
-
-            events, state = log_reader.wait_for_events(state, wait_step)
-            if not events:
-                if (not rebounded) and (not anchor_seen) and time.time() >= anchor_grace_deadline:
-                    log_reader = ClaudeLogReader(work_dir=Path(session.work_dir), use_sessions_index=False)
-                    log_hint = log_reader.current_session_path()
-                    state = _tail_state_for_log(log_hint, tail_bytes=tail_bytes)
-                    fallback_scan = True
-                    rebounded = True
-                continue
-
-            for role, text in events:
-                if role == "user":
-                    if f"{REQ_ID_PREFIX} {task.req_id}" in text:
-                        anchor_seen = True
-                        if anchor_ms is None:
-                            anchor_ms = _now_ms() - started_ms
-                    continue
-                if role != "assistant":
+                    last_pane_check = clock()
+
+                events, state = log_reader.wait_for_events(state, wait_step)
+                now = clock()
+                if events:
+                    last_event_at = now
+                if not events:
+                    if (not rebounded) and (not anchor_seen) and now >= anchor_grace_deadline:
+                        log_reader.rebind(use_sessions_index=False)
+                        log_hint = log_reader.current_session_path()
+                        state = _tail_state_for_log(log_hint, tail_bytes=tail_bytes)
+                        watch = _rewatch_log(log_reader, state, watch)
+                        fallback_scan = True
+                        rebounded = True
                     continue
-                if (not anchor_seen) and time.time() < anchor_collect_grace:
-                    continue
-                chunks.append(text)
-                combined = "\n".join(chunks)
-                if is_done_text(combined, task.req_id):
-                    done_seen = True
-                    done_ms = _now_ms() - started_ms
-                    break
 
-            if done_seen:
-                break
+                for role, text in events:
+                    if role == "user":
+                        if anchor_needle in text:
+                            anchor_seen = True
+                            if anchor_ms is None:
+                                anchor_ms = _now_ms() - started_ms
+                        continue
+                    if role != "assistant":
+                        continue
+                    if (not anchor_seen) and now < anchor_collect_grace:
+                        continue
+                    chunks.append(text)
+                    # Earlier chunks were already checked, so only the newest one can complete the reply.
+                    if is_done_text(text, task.req_id):
+                        done_seen = True
+                        done_ms = _now_ms() - started_ms
+                        break
+
+                if done_seen:
+                    break
+        finally:
+            if watch is not None:
+                get_shared_watcher().unsubscribe(*watch)
 
         combined = "\n".join(chunks)
         final_reply = extract_reply_for_req(combined, task.req_id)
@@ -291,19 +363,53 @@ class _SessionWorker(BaseSessionWorker[_QueuedTask, LaskdResult]):
             f"anchor={result.anchor_seen} done={result.done_seen} fallback={result.fallback_scan} "
             f"anchor_ms={result.anchor_ms or ''} done_ms={result.done_ms or ''}"
         )
+        self._coalesce_queued(task, result)
         return result
 
 
+_SESSION_KEY_CACHE_MAX = 256
+
+
 class _WorkerPool:
     def __init__(self):
         self._pool = PerSessionWorkerPool[_SessionWorker]()
+        # work_dir -> ((session file, st_mtime_ns, st_size), session key); see _session_key_for().
+        self._session_keys: dict[str, tuple[tuple[str, int, int], str]] = {}
+
+    def _session_key_for(self, work_dir: Path) -> str:
+        """
+        Routing key for work_dir, reusing the last one while its .claude-session file is unchanged.
+
+        The worker loads the full session itself in _handle_task; submit() only needs the key.
+        """
+        stamp: Optional[tuple[str, int, int]] = None
+        session_file = find_project_session_file(work_dir, ".claude-session")
+        if session_file:
+            try:
+                st = session_file.stat()
+                stamp = (str(session_file), st.st_mtime_ns, st.st_size)
+            except OSError:
+                stamp = None
+        cache_key = str(work_dir)
+        cached = self._session_keys.get(cache_key) if stamp else None
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        session = load_project_session(work_dir)
+        if not session:
+            return "claude:unknown"
+        session_key = compute_session_key(session)
+        if stamp:
+            if len(self._session_keys) >= _SESSION_KEY_CACHE_MAX:
+                self._session_keys.clear()
+            self._session_keys[cache_key] = (stamp, session_key)
+        return session_key
 
     def submit(self, request: LaskdRequest) -> _QueuedTask:
         req_id = request.req_id or make_req_id()
         task = _QueuedTask(request=request, created_ms=_now_ms(), req_id=req_id, done_event=threading.Event())
 
-        session = load_project_session(Path(request.work_dir))
-        session_key = compute_session_key(session) if session else "claude:unknown"
+        session_key = self._session_key_for(Path(request.work_dir))
 
         worker = self._pool.get_or_create(session_key, _SessionWorker)
         worker.enqueue(task)
@@ -317,6 +423,7 @@ class LaskdServer:
         self.state_file = state_file or state_file_path(LASKD_SPEC.state_file_name)
         self.token = random_token()
         self.pool = _WorkerPool()
+        self._owned_pid = os.getpid()
 
     def serve_forever(self) -> int:
         def _handle_request(msg: dict) -> dict:
@@ -371,19 +478,12 @@ class LaskdServer:
         return server.serve_forever()
 
     def _cleanup_state_file(self) -> None:
+        # on_stop runs while AskDaemonServer still holds the provider lock, so no other laskd can
+        # have rewritten the state file since this process wrote it; no need to read back its pid.
+        if os.getpid() != self._owned_pid:
+            return
         try:
-            st = read_state(self.state_file)
-        except Exception:
-            st = None
-        try:
-            if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid():
-                self.state_file.unlink(missing_ok=True)
-        except TypeError:
-            try:
-                if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid() and self.state_file.exists():
-                    self.state_file.unlink()
-            except Exception:
-                pass
+            self.state_file.unlink(missing_ok=True)
         except Exception:
             pass
 
@@ -9,6 +9,7 @@ from ccb_protocol import (
     BEGIN_PREFIX,
     DONE_PREFIX,
     REQ_ID_PREFIX,
+    done_line_re,
     is_done_text,
     make_req_id,
     strip_done_text,
@@ -87,16 +88,20 @@ def extract_reply_for_req(text: str, req_id: str) -> str:
         return ""
 
     # Find last done-line index for this req_id (may not be last line if the model misbehaves).
-    target_re = re.compile(rf"^\s*CCB_DONE:\s*{re.escape(req_id)}\s*$", re.IGNORECASE)
+    target_re = done_line_re(req_id, ignore_case=True)
     begin_re = re.compile(rf"^\s*{re.escape(BEGIN_PREFIX)}\s*{re.escape(req_id)}\s*$", re.IGNORECASE)
-    done_idxs = [i for i, ln in enumerate(lines) if ANY_DONE_LINE_RE.match(ln or "")]
-    target_idxs = [i for i in done_idxs if target_re.match(lines[i] or "")]
+    # Scan backwards: the target is normally the last line, so this stops almost immediately.
+    target_i = None
+    for i in range(len(lines) - 1, -1, -1):
+        ln = lines[i]
+        if target_re.match(ln) and ANY_DONE_LINE_RE.match(ln):
+            target_i = i
+            break
 
-    if not target_idxs:
+    if target_i is None:
         # Fallback: keep existing behavior (strip only if the last line matches).
         return strip_done_text(text, req_id)
 
-    target_i = target_idxs[-1]
     begin_i = None
     for i in range(target_i - 1, -1, -1):
         if begin_re.match(lines[i] or ""):
@@ -107,8 +112,8 @@ def extract_reply_for_req(text: str, req_id: str) -> str:
         segment = lines[begin_i + 1 : target_i]
     else:
         prev_done_i = -1
-        for i in reversed(done_idxs):
-            if i < target_i:
+        for i in range(target_i - 1, -1, -1):
+            if ANY_DONE_LINE_RE.match(lines[i]):
                 prev_done_i = i
                 break
         segment = lines[prev_done_i + 1 : target_i]
@@ -157,7 +162,7 @@ class LaskdRequest:
     no_wrap: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LaskdResult:
     exit_code: int
     reply: str
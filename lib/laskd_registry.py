@@ -6,16 +6,21 @@ Monitors active sessions and refreshes log bindings periodically to adapt to ses
 
 from __future__ import annotations
 
+import functools
 import heapq
 import json
 import os
 import re
+import stat
 import threading
 import time
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+import json_fast
+from env_utils import env_float, env_int
 from laskd_session import ClaudeProjectSession, load_project_session, _maybe_auto_extract_old_session
 from project_id import compute_ccb_project_id, normalize_work_dir
 from session_file_watcher import HAS_WATCHDOG, SessionFileWatcher
@@ -36,25 +41,28 @@ CLAUDE_PROJECTS_ROOT = Path(
 
 SESSION_ID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE)
 
+_BIND_REFRESH_INTERVAL_S = env_float("CCB_LASKD_BIND_REFRESH_INTERVAL", 60.0)
+_BIND_SCAN_LIMIT = max(50, min(20000, env_int("CCB_LASKD_BIND_SCAN_LIMIT", 400)))
 
-def _env_float(key: str, default: float) -> float:
-    try:
-        return float(os.environ.get(key, str(default)) or str(default))
-    except Exception:
-        return default
+_PROJECT_KEY_UNSAFE = re.compile(r"[^A-Za-z0-9]")
 
 
-def _env_int(key: str, default: int) -> int:
-    try:
-        return int(os.environ.get(key, str(default)) or str(default))
-    except Exception:
-        return default
+def _project_key_for_path(path: Path) -> str:
+    return _PROJECT_KEY_UNSAFE.sub("-", str(path))
 
 
-def _project_key_for_path(path: Path) -> str:
-    return re.sub(r"[^A-Za-z0-9]", "-", str(path))
+@functools.lru_cache(maxsize=256)
+def _project_keys_for_work_dir(work_dir: Path) -> tuple[str, Optional[str]]:
+    """Return (key, resolved_key) for work_dir; resolved_key is None when resolve() changes nothing."""
+    try:
+        resolved = work_dir.resolve()
+    except Exception:
+        resolved = work_dir
+    alt_key = _project_key_for_path(resolved) if resolved != work_dir else None
+    return _project_key_for_path(work_dir), alt_key
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize_project_path(value: str | Path) -> str:
     raw = str(value or "").strip()
     if not raw:
@@ -107,12 +115,41 @@ def _extract_session_id_from_start_cmd(start_cmd: str) -> Optional[str]:
     return match.group(0)
 
 
-def _find_log_for_session_id(session_id: str, *, root: Path = CLAUDE_PROJECTS_ROOT) -> Optional[Path]:
+def _find_log_for_session_id(
+    session_id: str, *, root: Path = CLAUDE_PROJECTS_ROOT, work_dir: Optional[Path] = None
+) -> Optional[Path]:
+    """
+    Find the log for session_id. Claude writes it as <root>/<project key>/<session_id>.jsonl, so
+    the work_dir's project directories are tried first, then that name in every project directory;
+    only when both miss is the whole tree searched for a file name containing session_id.
+    """
     root = Path(root).expanduser()
     if not session_id or not root.exists():
         return None
+    name = f"{session_id}.jsonl"
+    if work_dir is not None:
+        for project_key in _project_keys_for_work_dir(work_dir):
+            if project_key and (root / project_key / name).is_file():
+                return root / project_key / name
+
     latest: Optional[Path] = None
     latest_mtime = -1.0
+    try:
+        project_dirs = [entry.path for entry in os.scandir(root) if entry.is_dir()]
+    except OSError:
+        project_dirs = []
+    for project_dir in project_dirs:
+        candidate = os.path.join(project_dir, name)
+        try:
+            st = os.stat(candidate)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_mtime >= latest_mtime:
+            latest = Path(candidate)
+            latest_mtime = st.st_mtime
+    if latest is not None:
+        return latest
+
     try:
         patterns = [f"**/{session_id}.jsonl", f"**/*{session_id}*.jsonl"]
         seen: set[str] = set()
@@ -140,9 +177,10 @@ def _read_session_meta(log_path: Path) -> tuple[Optional[str], Optional[str], Op
     """
     Read session metadata for (cwd, session_id, is_sidechain).
     Claude logs have various structures; we scan the first 30 lines.
+    Lines are parsed as raw bytes, without a text decode, since this runs for every scan candidate.
     """
     try:
-        with log_path.open("r", encoding="utf-8", errors="ignore") as handle:
+        with log_path.open("rb") as handle:
             for _ in range(30):
                 line = handle.readline()
                 if not line:
@@ -151,7 +189,7 @@ def _read_session_meta(log_path: Path) -> tuple[Optional[str], Optional[str], Op
                 if not line:
                     continue
                 try:
-                    entry = json.loads(line)
+                    entry = json_fast.loads(line)
                 except Exception:
                     continue
                 if not isinstance(entry, dict):
@@ -175,29 +213,8 @@ def _read_session_meta(log_path: Path) -> tuple[Optional[str], Optional[str], Op
 
 def _path_within(child: str, parent: str) -> bool:
     """Check if child path is within parent path (case-insensitive on Windows)."""
-    try:
-        child_path = Path(child).expanduser()
-        parent_path = Path(parent).expanduser()
-        try:
-            child_path = child_path.resolve()
-        except Exception:
-            child_path = child_path.absolute()
-        try:
-            parent_path = parent_path.resolve()
-        except Exception:
-            parent_path = parent_path.absolute()
-        child = str(child_path)
-        parent = str(parent_path)
-    except Exception:
-        pass
-    if os.name == "nt":
-        child = child.lower().replace("\\", "/")
-        parent = parent.lower().replace("\\", "/")
-    else:
-        child = child.replace("\\", "/")
-        parent = parent.replace("\\", "/")
-    child = child.rstrip("/")
-    parent = parent.rstrip("/")
+    child = _normalize_project_path(child)
+    parent = _normalize_project_path(parent)
     if child == parent:
         return True
     return child.startswith(parent + "/")
@@ -248,6 +265,29 @@ def _ensure_claude_session_work_dir_fields(payload: dict, session_file: Path) ->
     return work_dir_path
 
 
+def _iter_session_logs(root: str) -> Iterator[tuple[float, str]]:
+    """
+    Yield (mtime, path) for every *.jsonl under root, using scandir's cached entry type.
+    Hidden entries and subagents/ directories (sidechain-only logs) are pruned.
+    """
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        name = entry.name
+        if name.startswith("."):
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if name != "subagents":
+                    yield from _iter_session_logs(entry.path)
+            elif name.endswith(".jsonl") and entry.is_file():
+                yield entry.stat().st_mtime, entry.path
+        except OSError:
+            continue
+
+
 def _scan_latest_log_for_work_dir(
     work_dir: Path, *, root: Path = CLAUDE_PROJECTS_ROOT, scan_limit: int
 ) -> tuple[Optional[Path], Optional[str]]:
@@ -261,25 +301,12 @@ def _scan_latest_log_for_work_dir(
 
     work_dir_str = str(work_dir)
 
-    heap: list[tuple[float, str]] = []
     try:
-        for p in root.glob("**/*.jsonl"):
-            if not p.is_file() or p.name.startswith("."):
-                continue
-            try:
-                mtime = p.stat().st_mtime
-            except OSError:
-                continue
-            item = (mtime, str(p))
-            if len(heap) < scan_limit:
-                heapq.heappush(heap, item)
-            else:
-                if item[0] > heap[0][0]:
-                    heapq.heapreplace(heap, item)
+        # nlargest keeps the bounded heap in C and returns the logs newest first.
+        candidates = heapq.nlargest(scan_limit, _iter_session_logs(str(root)), key=itemgetter(0))
     except Exception:
         return None, None
 
-    candidates = sorted(heap, key=lambda x: x[0], reverse=True)
     for _, path_str in candidates:
         path = Path(path_str)
         cwd, sid, is_sidechain = _read_session_meta(path)
@@ -292,30 +319,18 @@ def _scan_latest_log_for_work_dir(
     return None, None
 
 
-def _parse_sessions_index(work_dir: Path, *, root: Path = CLAUDE_PROJECTS_ROOT) -> Optional[Path]:
-    """
-    Parse sessions-index.json to find the correct session for work_dir.
-    Returns the log path if found.
-    """
-    candidates = set(_candidate_project_paths(work_dir))
+# Parsed sessions-index.json entries keyed by (index path, work_dir) and stamped with the index's
+# (st_mtime_ns, st_size): known holds (mtime, position, path) sorted newest first, unknown holds the
+# (position, path) entries without a usable fileMtime.
+_INDEX_CACHE: dict[tuple[str, str], tuple[tuple[int, int], list[tuple[int, int, Path]], list[tuple[int, Path]]]] = {}
+_INDEX_CACHE_MAX = 256
 
-    project_key = _project_key_for_path(work_dir)
-    project_dir = root / project_key
-    index_path = project_dir / "sessions-index.json"
-    if not index_path.exists():
-        try:
-            resolved = work_dir.resolve()
-        except Exception:
-            resolved = work_dir
-        if resolved != work_dir:
-            alt_key = _project_key_for_path(resolved)
-            index_path = root / alt_key / "sessions-index.json"
-            project_dir = root / alt_key
-    if not index_path.exists():
-        return None
 
+def _load_sessions_index(
+    index_path: Path, project_dir: Path, work_dir: Path
+) -> Optional[tuple[list[tuple[int, int, Path]], list[tuple[int, Path]]]]:
     try:
-        payload = json.loads(index_path.read_text(encoding="utf-8", errors="replace"))
+        payload = json_fast.loads(index_path.read_bytes())
     except Exception:
         return None
 
@@ -323,9 +338,10 @@ def _parse_sessions_index(work_dir: Path, *, root: Path = CLAUDE_PROJECTS_ROOT)
     if not isinstance(entries, list):
         return None
 
-    best_path: Optional[Path] = None
-    best_mtime = -1
-    for entry in entries:
+    candidates = set(_candidate_project_paths(work_dir))
+    known: list[tuple[int, int, Path]] = []
+    unknown: list[tuple[int, Path]] = []
+    for position, entry in enumerate(entries):
         if not isinstance(entry, dict):
             continue
         if entry.get("isSidechain") is True:
@@ -346,8 +362,6 @@ def _parse_sessions_index(work_dir: Path, *, root: Path = CLAUDE_PROJECTS_ROOT)
             continue
         if not session_path.is_absolute():
             session_path = (project_dir / session_path).expanduser()
-        if not session_path.exists():
-            continue
         mtime_raw = entry.get("fileMtime")
         mtime = None
         if isinstance(mtime_raw, (int, float)):
@@ -358,25 +372,75 @@ def _parse_sessions_index(work_dir: Path, *, root: Path = CLAUDE_PROJECTS_ROOT)
             except Exception:
                 mtime = None
         if mtime is None:
-            try:
-                mtime = int(session_path.stat().st_mtime * 1000)
-            except OSError:
-                mtime = None
-        if mtime is None:
+            unknown.append((position, session_path))
+        elif mtime >= 0:
+            known.append((mtime, position, session_path))
+    known.sort(key=lambda item: (-item[0], item[1]))
+    return known, unknown
+
+
+def _parse_sessions_index(work_dir: Path, *, root: Path = CLAUDE_PROJECTS_ROOT) -> Optional[Path]:
+    """
+    Parse sessions-index.json to find the correct session for work_dir.
+    Returns the log path if found.
+
+    The filtered entries are cached until the index file changes; which logs exist (and the mtime of
+    entries without fileMtime) is still checked on every call.
+    """
+    project_key, alt_key = _project_keys_for_work_dir(work_dir)
+    project_dir = root / project_key
+    index_path = project_dir / "sessions-index.json"
+    try:
+        st = index_path.stat()
+    except OSError:
+        if alt_key is None:
+            return None
+        project_dir = root / alt_key
+        index_path = project_dir / "sessions-index.json"
+        try:
+            st = index_path.stat()
+        except OSError:
+            return None
+
+    key = (str(index_path), str(work_dir))
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _INDEX_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        known, unknown = cached[1], cached[2]
+    else:
+        loaded = _load_sessions_index(index_path, project_dir, work_dir)
+        if loaded is None:
+            _INDEX_CACHE.pop(key, None)
+            return None
+        known, unknown = loaded
+        if len(_INDEX_CACHE) >= _INDEX_CACHE_MAX:
+            _INDEX_CACHE.clear()
+        _INDEX_CACHE[key] = (stamp, known, unknown)
+
+    # Newest entry wins; ties go to the entry listed first in the index.
+    best: Optional[tuple[int, int, Path]] = None
+    for item in known:
+        if item[2].exists():
+            best = item
+            break
+    for position, session_path in unknown:
+        try:
+            mtime = int(session_path.stat().st_mtime * 1000)
+        except OSError:
+            continue
+        if mtime < 0:
             continue
-        if mtime > best_mtime:
-            best_mtime = mtime
-            best_path = session_path
-    return best_path
+        if best is None or mtime > best[0] or (mtime == best[0] and position < best[1]):
+            best = (mtime, position, session_path)
+    return best[2] if best is not None else None
 
 
 def _should_overwrite_binding(current: Optional[Path], candidate: Path) -> bool:
     if not current:
         return True
-    if not current.exists():
-        return True
     try:
-        return candidate.stat().st_mtime > current.stat().st_mtime
+        current_mtime = current.stat().st_mtime
+        return candidate.stat().st_mtime > current_mtime
     except OSError:
         return True
 
@@ -395,6 +459,8 @@ def _refresh_claude_log_binding(
       1) Parse session_id from start_cmd (e.g., "claude resume <uuid>") and bind to its log.
       2) Use sessions-index.json to select the best session.
       3) Fallback scan latest log by work_dir (only when forced or when (1)/(2) fail).
+
+    Each lookup only returns logs it has just found on disk, so they are not re-checked here.
     """
     current_log_str = session.claude_session_path
     current_log = Path(current_log_str).expanduser() if current_log_str else None
@@ -403,15 +469,15 @@ def _refresh_claude_log_binding(
     intended_sid = _extract_session_id_from_start_cmd(start_cmd)
     intended_log: Optional[Path] = None
     if intended_sid:
-        intended_log = _find_log_for_session_id(intended_sid, root=root)
-        if intended_log and intended_log.exists():
+        intended_log = _find_log_for_session_id(intended_sid, root=root, work_dir=Path(session.work_dir))
+        if intended_log:
             if _should_overwrite_binding(current_log, intended_log) or session.claude_session_id != intended_sid:
                 session.update_claude_binding(session_path=intended_log, session_id=intended_sid)
                 return True
             return False
 
     index_session = _parse_sessions_index(Path(session.work_dir), root=root)
-    if index_session and index_session.exists():
+    if index_session:
         index_sid = index_session.stem
         if _should_overwrite_binding(current_log, index_session) or session.claude_session_id != index_sid:
             session.update_claude_binding(session_path=index_session, session_id=index_sid)
@@ -426,7 +492,7 @@ def _refresh_claude_log_binding(
     candidate_log, candidate_sid = _scan_latest_log_for_work_dir(
         Path(session.work_dir), root=root, scan_limit=scan_limit
     )
-    if not candidate_log or not candidate_log.exists():
+    if not candidate_log:
         return False
 
     if _should_overwrite_binding(current_log, candidate_log) or (
@@ -446,7 +512,7 @@ def _write_log(line: str) -> None:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class _SessionEntry:
     work_dir: Path
     session: Optional[ClaudeProjectSession]
@@ -458,7 +524,7 @@ class _SessionEntry:
     bind_backoff_s: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class _WatcherEntry:
     watcher: SessionFileWatcher
     keys: set[str] = field(default_factory=set)
@@ -495,28 +561,30 @@ class LaskdSessionRegistry:
         key = str(work_dir)
         with self._lock:
             entry = self._sessions.get(key)
-            if entry:
-                session_file = (
-                    entry.session_file
-                    or find_project_session_file(work_dir, ".claude-session")
-                    or (resolve_project_config_dir(work_dir) / ".claude-session")
-                )
-                if session_file.exists():
-                    try:
-                        current_mtime = session_file.stat().st_mtime
-                        if (not entry.session_file) or (session_file != entry.session_file) or (current_mtime != entry.file_mtime):
-                            _write_log(f"[INFO] Session file changed, reloading: {work_dir}")
-                            entry = self._load_and_cache(work_dir)
-                    except Exception:
-                        pass
+        if not entry:
+            entry = self._load_and_cache(work_dir)
+            return entry.session if entry else None
 
-                if entry and entry.valid:
-                    return entry.session
-            else:
-                entry = self._load_and_cache(work_dir)
-                if entry:
-                    return entry.session
+        # Stat and reload outside the lock: loading runs ensure_pane, which talks to the terminal.
+        session_file = (
+            entry.session_file
+            or find_project_session_file(work_dir, ".claude-session")
+            or (resolve_project_config_dir(work_dir) / ".claude-session")
+        )
+        try:
+            current_mtime = session_file.stat().st_mtime
+        except OSError:
+            current_mtime = None
+        if current_mtime is not None:
+            try:
+                if (not entry.session_file) or (session_file != entry.session_file) or (current_mtime != entry.file_mtime):
+                    _write_log(f"[INFO] Session file changed, reloading: {work_dir}")
+                    entry = self._load_and_cache(work_dir)
+            except Exception:
+                pass
 
+        if entry and entry.valid:
+            return entry.session
         return None
 
     def register_session(self, work_dir: Path, session: ClaudeProjectSession) -> None:
@@ -576,7 +644,8 @@ class LaskdSessionRegistry:
             next_bind_refresh=0.0,
             bind_backoff_s=0.0,
         )
-        self._sessions[str(work_dir)] = entry
+        with self._lock:
+            self._sessions[str(work_dir)] = entry
         return entry if entry.valid else None
 
     def invalidate(self, work_dir: Path) -> None:
@@ -601,15 +670,15 @@ class LaskdSessionRegistry:
 
     def _check_all_sessions(self) -> None:
         now = time.time()
-        refresh_interval_s = _env_float("CCB_LASKD_BIND_REFRESH_INTERVAL", 60.0)
-        scan_limit = max(50, min(20000, _env_int("CCB_LASKD_BIND_SCAN_LIMIT", 400)))
 
         with self._lock:
             snapshot = [(key, entry.work_dir) for key, entry in self._sessions.items() if entry.valid]
 
         for key, work_dir in snapshot:
             try:
-                self._check_one(key, work_dir, now=now, refresh_interval_s=refresh_interval_s, scan_limit=scan_limit)
+                self._check_one(
+                    key, work_dir, now=now, refresh_interval_s=_BIND_REFRESH_INTERVAL_S, scan_limit=_BIND_SCAN_LIMIT
+                )
             except Exception:
                 continue
 
@@ -627,12 +696,10 @@ class LaskdSessionRegistry:
 
     def _check_one(self, key: str, work_dir: Path, *, now: float, refresh_interval_s: float, scan_limit: int) -> None:
         session_file = find_project_session_file(work_dir, ".claude-session") or (resolve_project_config_dir(work_dir) / ".claude-session")
+        # One stat answers both "does it still exist" and "has it changed".
         try:
-            exists = session_file.exists()
-        except Exception:
-            exists = False
-
-        if not exists:
+            current_mtime = session_file.stat().st_mtime
+        except OSError:
             with self._lock:
                 entry = self._sessions.get(key)
                 if entry and entry.valid:
@@ -641,26 +708,22 @@ class LaskdSessionRegistry:
                     entry.last_check = now
             return
 
-        try:
-            current_mtime = session_file.stat().st_mtime
-        except Exception:
-            current_mtime = 0.0
-
-        session: Optional[ClaudeProjectSession] = None
-        file_changed = False
-
         with self._lock:
             entry = self._sessions.get(key)
             if not entry or not entry.valid:
                 return
             file_changed = bool((entry.session_file != session_file) or (entry.file_mtime != current_mtime))
-            if file_changed or (entry.session is None):
-                session = load_project_session(work_dir)
+            session = entry.session
+
+        if file_changed or (session is None):
+            session = load_project_session(work_dir)
+            with self._lock:
+                entry = self._sessions.get(key)
+                if not entry or not entry.valid:
+                    return
                 entry.session = session
                 entry.session_file = session_file
                 entry.file_mtime = current_mtime
-            else:
-                session = entry.session
 
         if not session:
             with self._lock:
@@ -722,15 +785,12 @@ class LaskdSessionRegistry:
 
     def _project_dirs_for_work_dir(self, work_dir: Path, *, include_missing: bool = False) -> list[Path]:
         dirs: list[Path] = []
-        primary = self._claude_root / _project_key_for_path(work_dir)
+        project_key, alt_key = _project_keys_for_work_dir(work_dir)
+        primary = self._claude_root / project_key
         if include_missing or primary.exists():
             dirs.append(primary)
-        try:
-            resolved = work_dir.resolve()
-        except Exception:
-            resolved = work_dir
-        if resolved != work_dir:
-            alt = self._claude_root / _project_key_for_path(resolved)
+        if alt_key is not None:
+            alt = self._claude_root / alt_key
             if (include_missing or alt.exists()) and alt not in dirs:
                 dirs.append(alt)
         return dirs
@@ -856,6 +916,26 @@ class LaskdSessionRegistry:
     def _find_claude_session_file(self, work_dir: Path) -> Optional[Path]:
         return find_project_session_file(work_dir, ".claude-session") or (resolve_project_config_dir(work_dir) / ".claude-session")
 
+    def _note_event_binding(self, key: str, session: ClaudeProjectSession) -> None:
+        """
+        Record a binding written by a watcher event on the monitored entry.
+
+        The event already bound the newest log, so the session file write is not treated as an
+        external change (which would force a full log scan) and the periodic rebind is pushed back.
+        """
+        try:
+            mtime = session.session_file.stat().st_mtime
+        except Exception:
+            return
+        with self._lock:
+            entry = self._sessions.get(key)
+            if not entry or not entry.valid or entry.session is not session:
+                return
+            if entry.session_file != session.session_file:
+                return
+            entry.file_mtime = mtime
+            entry.next_bind_refresh = max(entry.next_bind_refresh, time.time() + _BIND_REFRESH_INTERVAL_S)
+
     def _update_session_file_direct(self, session_file: Path, log_path: Path, session_id: str) -> None:
         if not session_file.exists():
             return
@@ -913,6 +993,7 @@ class LaskdSessionRegistry:
         if session:
             try:
                 session.update_claude_binding(session_path=path, session_id=session_id)
+                self._note_event_binding(key, session)
             except Exception:
                 pass
 
@@ -962,6 +1043,7 @@ class LaskdSessionRegistry:
                     continue
                 try:
                     session.update_claude_binding(session_path=path, session_id=session_id)
+                    self._note_event_binding(key, session)
                     updated_any = True
                 except Exception:
                     pass
@@ -984,6 +1066,7 @@ class LaskdSessionRegistry:
                 continue
             try:
                 session.update_claude_binding(session_path=path, session_id=session_id)
+                self._note_event_binding(key, session)
                 updated_any = True
             except Exception:
                 pass
@@ -1017,6 +1100,7 @@ class LaskdSessionRegistry:
                 continue
             try:
                 session.update_claude_binding(session_path=session_path, session_id=session_id)
+                self._note_event_binding(key, session)
             except Exception:
                 pass
 
@@ -6,6 +6,7 @@ Downloads and caches email attachments for processing by AI providers.
 
 import hashlib
 import os
+import re
 import shutil
 import time
 from dataclasses import dataclass
@@ -19,6 +20,8 @@ DEFAULT_CACHE_DIR = Path.home() / ".ccb" / "cache" / "mail_attachments"
 ATTACHMENT_TTL_SECONDS = 24 * 60 * 60
 # Maximum attachment size (10MB)
 MAX_ATTACHMENT_SIZE = 10 * 1024 * 1024
+# Characters dropped from attachment filenames (\w is str.isalnum() plus "_")
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w.-]")
 
 
 @dataclass
@@ -78,7 +81,7 @@ def save_attachment(
     msg_dir.mkdir(parents=True, exist_ok=True)
 
     # Sanitize filename
-    safe_filename = "".join(c for c in filename if c.isalnum() or c in "._-")
+    safe_filename = _UNSAFE_FILENAME_RE.sub("", filename)
     if not safe_filename:
         safe_filename = "attachment"
 
@@ -18,16 +18,22 @@ class FilterResult:
     blocked_reason: Optional[str] = None
 
 
+# ANSI escape codes
+ANSI_ESCAPE_PATTERN = r'\x1b\[[0-9;]*[a-zA-Z]'
+# Control characters (except newline, tab)
+CONTROL_CHARS_PATTERN = r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]'
+
 # Patterns to remove from outgoing emails
 OUTGOING_STRIP_PATTERNS = [
-    # ANSI escape codes
-    r'\x1b\[[0-9;]*[a-zA-Z]',
-    # Control characters (except newline, tab)
-    r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]',
+    ANSI_ESCAPE_PATTERN,
+    CONTROL_CHARS_PATTERN,
     # Very long lines (truncate to 500 chars)
     # Handled separately
 ]
 
+_ANSI_RE = re.compile(ANSI_ESCAPE_PATTERN)
+_CONTROL_CHARS_RE = re.compile(CONTROL_CHARS_PATTERN)
+
 # Patterns to remove from incoming emails
 INCOMING_STRIP_PATTERNS = [
     # Email signatures
@@ -75,11 +81,12 @@ def filter_outgoing(content: str, max_length: int = MAX_OUTGOING_LENGTH) -> Filt
     warnings = []
     filtered = content
 
-    # Remove ANSI escape codes
-    filtered = re.sub(r'\x1b\[[0-9;]*[a-zA-Z]', '', filtered)
+    # Remove ANSI escape codes (single pass over the whole buffer, only if ESC is present)
+    if '\x1b' in filtered:
+        filtered = _ANSI_RE.sub('', filtered)
 
     # Remove control characters
-    filtered = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', filtered)
+    filtered = _CONTROL_CHARS_RE.sub('', filtered)
 
     # Truncate very long lines
     lines = filtered.split('\n')
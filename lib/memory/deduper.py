@@ -7,6 +7,7 @@ Removes protocol markers, system noise, and deduplicates messages.
 from __future__ import annotations
 
 import re
+from collections import defaultdict
 from typing import Optional
 
 from .types import ConversationEntry
@@ -39,30 +40,24 @@ class ConversationDeduper:
     """Clean and deduplicate conversation content."""
 
     def __init__(self):
-        self._protocol_re = [re.compile(p, re.MULTILINE) for p in PROTOCOL_PATTERNS]
-        self._noise_re = [re.compile(p, re.DOTALL) for p in SYSTEM_NOISE_PATTERNS]
+        # One alternation, so each line is matched by a single regex call
+        self._protocol_re = re.compile("|".join(f"(?:{p})" for p in PROTOCOL_PATTERNS))
+        # Tag blocks are removed in one pass; the async notice runs to the next blank line, so it
+        # is stripped afterwards to keep its matches from swallowing the tags that follow it.
+        self._noise_re = re.compile("|".join(f"(?:{p})" for p in SYSTEM_NOISE_PATTERNS[:-1]), re.DOTALL)
+        self._async_noise_re = re.compile(SYSTEM_NOISE_PATTERNS[-1])
+        self._blank_lines_re = re.compile(r"\n{3,}")
 
     def strip_protocol_markers(self, text: str) -> str:
         """Remove CCB protocol markers from text."""
-        lines = text.split("\n")
-        cleaned = []
-        for line in lines:
-            skip = False
-            for pattern in self._protocol_re:
-                if pattern.match(line):
-                    skip = True
-                    break
-            if not skip:
-                cleaned.append(line)
-        return "\n".join(cleaned)
+        match = self._protocol_re.match
+        return "\n".join(line for line in text.split("\n") if not match(line))
 
     def strip_system_noise(self, text: str) -> str:
         """Remove system noise tags from text."""
-        result = text
-        for pattern in self._noise_re:
-            result = pattern.sub("", result)
+        result = self._async_noise_re.sub("", self._noise_re.sub("", text))
         # Clean up extra whitespace
-        result = re.sub(r"\n{3,}", "\n\n", result)
+        result = self._blank_lines_re.sub("\n\n", result)
         return result.strip()
 
     def clean_content(self, text: str) -> str:
@@ -79,24 +74,22 @@ class ConversationDeduper:
             return []
 
         result: list[ConversationEntry] = []
-        prev_hash: Optional[str] = None
+        prev_key: Optional[tuple[str, str]] = None
 
         for entry in entries:
-            # Normalize and hash content
-            normalized = self._normalize_for_hash(entry.content)
-            content_hash = f"{entry.role}:{hash(normalized)}"
+            # Compare normalized content directly; unequal lengths fail fast and there are no hash collisions
+            key = (entry.role, self._normalize_for_hash(entry.content))
 
-            if content_hash != prev_hash:
+            if key != prev_key:
                 result.append(entry)
-                prev_hash = content_hash
+                prev_key = key
 
         return result
 
     def _normalize_for_hash(self, text: str) -> str:
         """Normalize text for hash comparison."""
-        # Remove whitespace variations
-        text = re.sub(r"\s+", " ", text)
-        return text.strip().lower()
+        # Collapse whitespace variations (str.split() uses the same whitespace set as \s)
+        return " ".join(text.split()).lower()
 
     def collapse_tool_calls(
         self, entries: list[ConversationEntry]
@@ -134,41 +127,55 @@ class ConversationDeduper:
             return ""
 
         # Group by tool name
-        by_name: dict[str, list[dict]] = {}
+        by_name: defaultdict[str, list[dict]] = defaultdict(list)
         for tc in tool_calls:
-            name = tc.get("name", "unknown")
-            by_name.setdefault(name, []).append(tc)
-
-        parts = []
-        for name, calls in by_name.items():
-            if name in ("Read", "Glob", "Grep"):
-                # Extract file paths
-                files = []
-                for c in calls:
-                    inp = c.get("input", {})
-                    if isinstance(inp, dict):
-                        path = inp.get("file_path") or inp.get("path") or inp.get("pattern")
-                        if path:
-                            files.append(str(path).split("/")[-1])
-                if files:
-                    parts.append(f"{name} {len(calls)} file(s): {', '.join(files[:3])}")
-                else:
-                    parts.append(f"{name} {len(calls)} file(s)")
-            elif name in ("Edit", "Write"):
-                files = []
-                for c in calls:
-                    inp = c.get("input", {})
-                    if isinstance(inp, dict):
-                        path = inp.get("file_path")
-                        if path:
-                            files.append(str(path).split("/")[-1])
-                if files:
-                    parts.append(f"{name} {len(calls)} file(s): {', '.join(files[:3])}")
-                else:
-                    parts.append(f"{name} {len(calls)} file(s)")
-            elif name == "Bash":
-                parts.append(f"Bash {len(calls)} command(s)")
-            else:
-                parts.append(f"{name} x{len(calls)}")
+            by_name[tc.get("name", "unknown")].append(tc)
+
+        return "; ".join(
+            _TOOL_SUMMARIZERS.get(name, _summarize_other)(name, calls)
+            for name, calls in by_name.items()
+        )
+
+
+def _file_names(calls: list[dict], keys: tuple[str, ...]) -> list[str]:
+    files = []
+    for c in calls:
+        inp = c.get("input", {})
+        if isinstance(inp, dict):
+            path = next((inp[k] for k in keys if inp.get(k)), None)
+            if path:
+                files.append(str(path).rpartition("/")[2])
+    return files
+
+
+def _summarize_file_tool(name: str, calls: list[dict], keys: tuple[str, ...]) -> str:
+    files = _file_names(calls, keys)
+    if files:
+        return f"{name} {len(calls)} file(s): {', '.join(files[:3])}"
+    return f"{name} {len(calls)} file(s)"
+
+
+def _summarize_search(name: str, calls: list[dict]) -> str:
+    return _summarize_file_tool(name, calls, ("file_path", "path", "pattern"))
+
+
+def _summarize_edit(name: str, calls: list[dict]) -> str:
+    return _summarize_file_tool(name, calls, ("file_path",))
+
+
+def _summarize_bash(name: str, calls: list[dict]) -> str:
+    return f"Bash {len(calls)} command(s)"
+
+
+def _summarize_other(name: str, calls: list[dict]) -> str:
+    return f"{name} x{len(calls)}"
+
 
-        return "; ".join(parts)
+_TOOL_SUMMARIZERS = {
+    "Read": _summarize_search,
+    "Glob": _summarize_search,
+    "Grep": _summarize_search,
+    "Edit": _summarize_edit,
+    "Write": _summarize_edit,
+    "Bash": _summarize_bash,
+}
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable
 
@@ -90,3 +92,67 @@ class SessionFileWatcher:
             return
         self.observer.stop()
         self.observer.join(timeout=2.0)
+
+
+@dataclass
+class _SharedWatchEntry:
+    watcher: SessionFileWatcher
+    events: set[threading.Event] = field(default_factory=set)
+
+
+class SharedSessionFileWatcher:
+    """
+    One SessionFileWatcher per directory, shared by every waiter subscribed to it.
+
+    Each waiter subscribes a threading.Event; a change in the directory sets all of them.
+    The watcher is started by the first subscriber and stopped when the last one leaves.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, _SharedWatchEntry] = {}
+
+    def subscribe(self, directory: Path, event: threading.Event) -> bool:
+        """Returns False without watchdog; a watcher that fails to start raises."""
+        if not HAS_WATCHDOG:
+            return False
+        key = str(directory)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                entry.events.add(event)
+                return True
+            watcher = SessionFileWatcher(Path(directory), callback=lambda _path, key=key: self._notify(key))
+            watcher.start()
+            self._entries[key] = _SharedWatchEntry(watcher=watcher, events={event})
+        return True
+
+    def unsubscribe(self, directory: Path, event: threading.Event) -> None:
+        key = str(directory)
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return
+            entry.events.discard(event)
+            if entry.events:
+                return
+            self._entries.pop(key, None)
+        # Stop outside the lock: the observer thread may be waiting on it in _notify().
+        try:
+            entry.watcher.stop()
+        except Exception:
+            pass
+
+    def _notify(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            events = list(entry.events) if entry else []
+        for event in events:
+            event.set()
+
+
+_SHARED_WATCHER = SharedSessionFileWatcher()
+
+
+def get_shared_watcher() -> SharedSessionFileWatcher:
+    return _SHARED_WATCHER
@@ -610,12 +610,41 @@ class TmuxBackend(TerminalBackend):
         if cp.returncode != 0:
             return None
         text = cp.stdout or ""
+        if "\x1b" not in text:
+            return text
         return self._ANSI_RE.sub("", text)
 
     # Keep compatibility with existing daemon code
     def get_text(self, pane_id: str, lines: int = 20) -> Optional[str]:
         return self.get_pane_content(pane_id, lines=lines)
 
+    def probe(self, pane_id: str, lines: int = 20) -> tuple[bool, Optional[str]]:
+        """
+        is_alive() plus get_text() in a single tmux invocation.
+
+        Returns (alive, text); text is None when the pane is gone or could not be captured.
+        """
+        if not pane_id:
+            return False, None
+        if not self._looks_like_tmux_target(pane_id):
+            if not self.is_alive(pane_id):
+                return False, None
+            return True, self.get_text(pane_id, lines=lines)
+        n = max(1, int(lines))
+        cp = self._tmux_run(
+            ["display-message", "-p", "-t", pane_id, "#{pane_dead}", ";", "capture-pane", "-t", pane_id, "-p", "-S", f"-{n}"],
+            capture=True,
+        )
+        flag, _, text = (cp.stdout or "").partition("\n")
+        if flag.strip() != "0":
+            return False, None
+        if cp.returncode != 0:
+            # The pane answered display-message but capture-pane failed.
+            return True, None
+        if "\x1b" in text:
+            text = self._ANSI_RE.sub("", text)
+        return True, text
+
     def is_pane_alive(self, pane_id: str) -> bool:
         if not pane_id:
             return False
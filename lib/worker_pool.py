@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import queue
 import threading
+from collections import deque
 from typing import Callable, Generic, Optional, Protocol, TypeVar
 
 
@@ -21,20 +21,34 @@ class BaseSessionWorker(threading.Thread, Generic[TaskT, ResultT]):
     def __init__(self, session_key: str):
         super().__init__(daemon=True)
         self.session_key = session_key
-        self._q: "queue.Queue[TaskT]" = queue.Queue()
+        # deque append/popleft are atomic and this thread is the only consumer, so the deque needs
+        # no lock; `_wakeup` only signals that it may be non-empty.
+        self._tasks: deque[TaskT] = deque()
+        self._wakeup = threading.Event()
         self._stop_event = threading.Event()
 
     def enqueue(self, task: TaskT) -> None:
-        self._q.put(task)
+        self._tasks.append(task)
+        self._wakeup.set()
 
     def stop(self) -> None:
         self._stop_event.set()
+        self._wakeup.set()
+
+    def queued_tasks(self) -> list[TaskT]:
+        """Snapshot of the tasks still waiting behind the current one, oldest first."""
+        return list(self._tasks)
 
     def run(self) -> None:
         while not self._stop_event.is_set():
-            try:
-                task = self._q.get(timeout=0.2)
-            except queue.Empty:
+            if not self._tasks:
+                self._wakeup.wait()
+                # Clear before re-checking the deque, so an enqueue racing with this wake-up is not lost.
+                self._wakeup.clear()
+                continue
+            task = self._tasks.popleft()
+            if task.done_event.is_set():
+                # Already resolved while queued (e.g. coalesced with an identical earlier task).
                 continue
             try:
                 task.result = self._handle_task(task)
@@ -59,7 +73,10 @@ class PerSessionWorkerPool(Generic[WorkerT]):
         self._workers: dict[str, WorkerT] = {}
 
     def get_or_create(self, session_key: str, factory: Callable[[str], WorkerT]) -> WorkerT:
-        created = False
+        # Fast path without the lock: dict reads are atomic, and a live worker is never replaced.
+        worker = self._workers.get(session_key)
+        if worker is not None and worker.is_alive():
+            return worker
         with self._lock:
             worker = self._workers.get(session_key)
             # Check if worker thread is dead and needs replacement
@@ -69,8 +86,8 @@ class PerSessionWorkerPool(Generic[WorkerT]):
                 worker = None
             if worker is None:
                 worker = factory(session_key)
+                # Start under the lock: a published but not yet started worker would look dead to
+                # a concurrent caller and get replaced.
+                worker.start()
                 self._workers[session_key] = worker
-                created = True
-        if created:
-            worker.start()
         return worker
@@ -52,6 +52,14 @@ def test_is_done_text_recognizes_last_nonempty_line() -> None:
     assert is_done_text(only_harness_done, req_id) is False
 
 
+def test_is_done_text_tolerates_marker_spacing() -> None:
+    req_id = make_req_id()
+    assert is_done_text(f"hi\n  {DONE_PREFIX}{req_id}  \n", req_id) is True
+    assert is_done_text(f"hi\n{DONE_PREFIX}\t {req_id}\n", req_id) is True
+    assert is_done_text(f"hi\n{DONE_PREFIX} {req_id}x\n", req_id) is False
+    assert is_done_text(f"hi\nX{DONE_PREFIX} {req_id}\n", req_id) is False
+
+
 def test_strip_done_text_removes_done_line() -> None:
     req_id = make_req_id()
     text = f"line1\nline2\n{DONE_PREFIX} {req_id}\n\n"
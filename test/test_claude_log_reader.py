@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from claude_comm import ClaudeLogReader
+
+
+def _entry(role: str, text: str) -> str:
+    return json.dumps({"type": role, "message": {"role": role, "content": text}}) + "\n"
+
+
+def _make_log(tmp_path: Path) -> tuple[Path, Path]:
+    root = tmp_path / "projects"
+    project = root / "proj"
+    project.mkdir(parents=True)
+    log = project / "session.jsonl"
+    log.write_text(_entry("user", "hello"), encoding="utf-8")
+    return root, log
+
+
+def test_read_events_keeps_partial_line_as_carry(tmp_path: Path) -> None:
+    root, log = _make_log(tmp_path)
+    reader = ClaudeLogReader(root=root, work_dir=tmp_path, use_sessions_index=False)
+    reader.set_preferred_session(log)
+    state = reader.capture_state()
+
+    full = _entry("assistant", "reply one")
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write(full + full[:10])
+    events, state = reader.try_get_events(state)
+    assert events == [("assistant", "reply one")]
+    assert state["carry"] == full[:10].encode("utf-8")
+
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write(full[10:])
+    events, state = reader.try_get_events(state)
+    assert events == [("assistant", "reply one")]
+    assert state["carry"] == b""
+
+
+def test_change_event_wakes_blocking_read(tmp_path: Path) -> None:
+    root, log = _make_log(tmp_path)
+    reader = ClaudeLogReader(root=root, work_dir=tmp_path, use_sessions_index=False)
+    reader.set_preferred_session(log)
+    change_event = threading.Event()
+    reader.set_change_event(change_event, watched_dir=log.parent)
+    state = reader.capture_state()
+
+    def _writer() -> None:
+        time.sleep(0.1)
+        with log.open("a", encoding="utf-8") as handle:
+            handle.write(_entry("assistant", "done"))
+        change_event.set()
+
+    thread = threading.Thread(target=_writer)
+    thread.start()
+    started = time.time()
+    events, _ = reader.wait_for_events(state, timeout=5.0)
+    thread.join()
+    assert events == [("assistant", "done")]
+    assert time.time() - started < 2.0
+
+
+def test_read_events_restarts_after_truncation(tmp_path: Path) -> None:
+    root, log = _make_log(tmp_path)
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write(_entry("user", "padding " * 20))
+    reader = ClaudeLogReader(root=root, work_dir=tmp_path, use_sessions_index=False)
+    reader.set_preferred_session(log)
+    state = reader.capture_state()
+
+    log.write_text(_entry("assistant", "fresh"), encoding="utf-8")
+    events, state = reader.try_get_events(state)
+    assert events == [("assistant", "fresh")]
+    assert state["offset"] == log.stat().st_size
+
+    events, state = reader.try_get_events(state)
+    assert events == []
+
+
+def test_read_events_skips_non_message_entries(tmp_path: Path) -> None:
+    root, log = _make_log(tmp_path)
+    reader = ClaudeLogReader(root=root, work_dir=tmp_path, use_sessions_index=False)
+    reader.set_preferred_session(log)
+    state = reader.capture_state()
+
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"type": "summary", "summary": "chat about code"}) + "\n")
+        handle.write(json.dumps({"type": "ASSISTANT", "content": "upper"}) + "\n")
+        handle.write(_entry("assistant", "reply"))
+    events, _ = reader.try_get_events(state)
+    assert events == [("assistant", "upper"), ("assistant", "reply")]
+
+
+def test_rebind_drops_preferred_session_and_keeps_change_event(tmp_path: Path) -> None:
+    root, log = _make_log(tmp_path)
+    reader = ClaudeLogReader(root=root, work_dir=tmp_path)
+    stale = log.with_name("stale.jsonl")
+    stale.write_text(_entry("user", "old"), encoding="utf-8")
+    reader.set_preferred_session(stale)
+    change_event = threading.Event()
+    reader.set_change_event(change_event)
+
+    reader.rebind(use_sessions_index=False)
+    assert reader._preferred_session is None
+    assert reader._use_sessions_index is False
+    assert reader.change_event is change_event
+
+
+def test_blocking_read_polls_logs_outside_the_watched_dir(tmp_path: Path) -> None:
+    root, log = _make_log(tmp_path)
+    reader = ClaudeLogReader(root=root, work_dir=tmp_path, use_sessions_index=False)
+    reader.set_preferred_session(log)
+    reader.set_change_event(threading.Event(), watched_dir=root / "other")
+    assert not reader.watches_session(log)
+    state = reader.capture_state()
+
+    def _writer() -> None:
+        time.sleep(0.1)
+        with log.open("a", encoding="utf-8") as handle:
+            handle.write(_entry("assistant", "done"))
+
+    thread = threading.Thread(target=_writer)
+    thread.start()
+    started = time.time()
+    events, state = reader.wait_for_events(state, timeout=5.0)
+    thread.join()
+    assert events == [("assistant", "done")]
+    assert time.time() - started < 2.0
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from askd.adapters.base import ProviderRequest
+from askd.adapters.claude import ClaudeAdapter, _ReplyPolicy
+
+
+def _postprocess(message: str, reply: str) -> str:
+    req = ProviderRequest(
+        client_id="c", work_dir=".", timeout_s=1.0, quiet=True, message=message, caller="test"
+    )
+    return ClaudeAdapter()._postprocess_reply(req, reply)
+
+
+def test_plain_message_returns_reply_unchanged() -> None:
+    reply = "hello\nworld\n\n"
+    assert _postprocess("just say hello", reply) is reply
+
+
+def test_box_table_converted_to_markdown() -> None:
+    reply = "┌───┬───┐\n│ a │ b │\n├───┼───┤\n│ 1 │ 2 │\n└───┴───┘"
+    out = _postprocess("give me a markdown table", reply)
+    assert out == "| a | b |\n| --- | --- |\n| 1 | 2 |"
+
+
+def test_bash_fence_then_section_chain() -> None:
+    out = _postprocess("bash code block", "echo hi\nls  \n\n[done]\n\n")
+    assert out == "```bash\necho hi\nls  \n```\n\n[done]"
+
+
+def test_triplet_fences_already_fenced_is_untouched() -> None:
+    reply = "```python\ndef f():\n    pass\n```\n```json\n{}\n```\n```yaml\nname: x\n```"
+    assert _postprocess("python json yaml code block", reply) == reply
+
+
+def test_section_10_splits_single_description_line() -> None:
+    out = _postprocess("### Section 1..10", "Section 1\nFirst part. Second part.\n")
+    assert out == "### Section 1\nFirst part.\nSecond part."
+
+
+def test_reply_policy_flags_from_message() -> None:
+    assert _ReplyPolicy.from_message("just say hello").plain
+    policy = _ReplyPolicy.from_message("Markdown table plus a bash code block")
+    assert policy.markdown_table and policy.bash_fence
+    assert not (policy.triplet_fences or policy.release_notes or policy.section_10)
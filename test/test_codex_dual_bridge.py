@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from codex_dual_bridge import DualBridge
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires FIFOs")
+
+
+def _bridge(tmp_path: Path, monkeypatch) -> DualBridge:
+    monkeypatch.setenv("CODEX_TERMINAL", "tmux")
+    monkeypatch.setenv("CODEX_TMUX_SESSION", "codex-test")
+    monkeypatch.setattr(signal, "signal", lambda *_args: None)
+    os.mkfifo(tmp_path / "input.fifo", 0o600)
+    return DualBridge(tmp_path, "session")
+
+
+def test_read_request_returns_each_line_from_one_writer(tmp_path: Path, monkeypatch) -> None:
+    bridge = _bridge(tmp_path, monkeypatch)
+    bridge._open_fifo()
+    with (tmp_path / "input.fifo").open("w", encoding="utf-8") as fifo:
+        fifo.write(json.dumps({"content": "one"}) + "\n" + json.dumps({"content": "two"}) + "\n")
+
+    assert bridge._read_request(0.05) == {"content": "one"}
+    assert bridge._read_request(0.05) == {"content": "two"}
+    bridge._close_wait_handles()
+
+
+def test_wake_interrupts_blocking_read(tmp_path: Path, monkeypatch) -> None:
+    bridge = _bridge(tmp_path, monkeypatch)
+    bridge._open_wait_handles()
+    timer = threading.Timer(0.1, bridge._wake)
+    timer.start()
+    started = time.monotonic()
+    assert bridge._read_request(5.0) is None
+    timer.join()
+    assert time.monotonic() - started < 0.9
+    bridge._close_wait_handles()
+
+
+def test_read_request_follows_recreated_fifo(tmp_path: Path, monkeypatch) -> None:
+    bridge = _bridge(tmp_path, monkeypatch)
+    fifo_path = tmp_path / "input.fifo"
+    bridge._open_fifo()
+    fifo_path.unlink()
+    os.mkfifo(fifo_path, 0o600)
+
+    bridge._open_fifo()
+    with fifo_path.open("w", encoding="utf-8") as fifo:
+        fifo.write(json.dumps({"content": "new"}) + "\n")
+    assert bridge._read_request(0.05) == {"content": "new"}
+    bridge._close_wait_handles()
+
+
+def test_generated_markers_are_unique_within_one_second(tmp_path: Path, monkeypatch) -> None:
+    bridge = _bridge(tmp_path, monkeypatch)
+    monkeypatch.setattr(time, "time", lambda: 1700000000.0)
+    markers = {bridge._generate_marker() for _ in range(3)}
+    assert len(markers) == 3
+    assert all(marker.startswith(f"ask-1700000000-{os.getpid()}-") for marker in markers)
+
+
+def test_wait_handles_exist_only_while_running(tmp_path: Path, monkeypatch) -> None:
+    bridge = _bridge(tmp_path, monkeypatch)
+    assert bridge._selector is None and bridge._wake_r == -1
+
+    def _fail(_wait: float) -> None:
+        assert bridge._selector is not None
+        raise SystemExit(1)
+
+    monkeypatch.setattr(bridge, "_read_request", _fail)
+    with pytest.raises(SystemExit):
+        bridge.run()
+    assert bridge._selector is None
+    assert bridge._wake_r == -1 and bridge._wake_w == -1
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from codex_comm import CodexCommunicator, CodexLogReader
+
+SESSION_ID = "0199a1b2-c3d4-7e5f-8a9b-0c1d2e3f4a5b"
+
+
+def _assistant(text: str) -> str:
+    payload = {"type": "message", "role": "assistant", "content": [{"type": "output_text", "text": text}]}
+    return json.dumps({"type": "response_item", "payload": payload}) + "\n"
+
+
+def _make_log(tmp_path: Path) -> tuple[Path, Path]:
+    root = tmp_path / "sessions"
+    day = root / "2026" / "10" / "15"
+    day.mkdir(parents=True)
+    log = day / f"rollout-2026-10-15T10-00-00-{SESSION_ID}.jsonl"
+    meta = {"type": "session_meta", "payload": {"id": SESSION_ID, "cwd": str(tmp_path)}}
+    log.write_text(json.dumps(meta) + "\n", encoding="utf-8")
+    return root, log
+
+
+def _reader(root: Path, log: Path, tmp_path: Path) -> CodexLogReader:
+    return CodexLogReader(root=root, log_path=log, session_id_filter=SESSION_ID, work_dir=tmp_path)
+
+
+def test_change_event_wakes_blocking_read(tmp_path: Path) -> None:
+    root, log = _make_log(tmp_path)
+    reader = _reader(root, log, tmp_path)
+    change_event = threading.Event()
+    reader.set_change_event(change_event)
+    state = reader.capture_state()
+
+    def _writer() -> None:
+        time.sleep(0.1)
+        with log.open("a", encoding="utf-8") as handle:
+            handle.write(_assistant("done"))
+        change_event.set()
+
+    thread = threading.Thread(target=_writer)
+    thread.start()
+    started = time.time()
+    message, state = reader.wait_for_message(state, timeout=5.0)
+    thread.join()
+    assert message == "done"
+    assert state["offset"] == log.stat().st_size
+    assert time.time() - started < 2.0
+
+
+def test_scan_latest_skips_newer_logs_from_other_work_dirs(tmp_path: Path) -> None:
+    root, log = _make_log(tmp_path)
+    other = log.with_name("rollout-2026-10-15T11-00-00-other.jsonl")
+    meta = {"type": "session_meta", "payload": {"cwd": str(tmp_path / "elsewhere")}}
+    other.write_text(json.dumps(meta) + "\n", encoding="utf-8")
+    os.utime(log, (100, 100))
+    os.utime(other, (200, 200))
+
+    reader = CodexLogReader(root=root, work_dir=tmp_path)
+    assert reader._scan_latest() == log
+
+
+def test_read_skips_entries_without_messages(tmp_path: Path) -> None:
+    root, log = _make_log(tmp_path)
+    reader = _reader(root, log, tmp_path)
+    state = reader.capture_state()
+
+    call = {"type": "response_item", "payload": {"type": "function_call", "name": "shell", "arguments": "{}"}}
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(call) + "\n")
+        handle.write(_assistant("answer"))
+    message, state = reader.try_get_message(state)
+    assert message == "answer"
+    assert reader.latest_message() == "answer"
+
+
+def test_read_restarts_when_log_is_replaced(tmp_path: Path) -> None:
+    root, log = _make_log(tmp_path)
+    reader = _reader(root, log, tmp_path)
+    state = reader.capture_state()
+
+    replacement = log.with_suffix(".tmp")
+    replacement.write_text(_assistant("after rotation") + "x" * 200 + "\n", encoding="utf-8")
+    os.replace(replacement, log)
+    message, state = reader.try_get_message(state)
+    assert message == "after rotation"
+    assert state["offset"] == len(_assistant("after rotation").encode("utf-8"))
+
+
+def test_read_restarts_after_truncation(tmp_path: Path) -> None:
+    root, log = _make_log(tmp_path)
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write("x" * 500 + "\n")
+    reader = _reader(root, log, tmp_path)
+    state = reader.capture_state()
+
+    with log.open("w", encoding="utf-8") as handle:
+        handle.write(_assistant("fresh"))
+    message, state = reader.try_get_message(state)
+    assert message == "fresh"
+
+
+def test_current_log_path_reuses_recent_scan(tmp_path: Path, monkeypatch) -> None:
+    root, log = _make_log(tmp_path)
+    reader = CodexLogReader(root=root, work_dir=tmp_path)
+    calls = []
+    real_scan = reader._scan_latest
+    monkeypatch.setattr(reader, "_scan_latest", lambda: calls.append(1) or real_scan())
+
+    assert reader.current_log_path() == log
+    reader._preferred_log = None
+    assert reader.current_log_path() == log
+    assert len(calls) == 1
+
+    reader.invalidate()
+    reader._preferred_log = None
+    assert reader.current_log_path() == log
+    assert len(calls) == 2
+
+
+def test_extract_session_id_from_file_name_or_first_line(tmp_path: Path) -> None:
+    _root, log = _make_log(tmp_path)
+    assert CodexCommunicator._extract_session_id(log) == SESSION_ID
+
+    renamed = log.with_name("rollout-plain.jsonl")
+    meta = {"type": "session_meta", "payload": {"id": SESSION_ID, "instructions": "x" * 10000}}
+    renamed.write_text(json.dumps(meta) + "\n", encoding="utf-8")
+    assert CodexCommunicator._extract_session_id(renamed) == SESSION_ID
+
+    late = log.with_name("rollout-late.jsonl")
+    meta = {"type": "session_meta", "payload": {"instructions": "x" * 10000, "id": SESSION_ID}}
+    late.write_text(json.dumps(meta) + "\n", encoding="utf-8")
+    assert CodexCommunicator._extract_session_id(late) == SESSION_ID
+
+
+def test_scan_cache_is_shared_between_readers(tmp_path: Path, monkeypatch) -> None:
+    root, log = _make_log(tmp_path)
+    first = CodexLogReader(root=root, work_dir=tmp_path)
+    assert first.current_log_path() == log
+
+    second = CodexLogReader(root=root, work_dir=tmp_path)
+    monkeypatch.setattr(second, "_scan_latest", lambda: None)
+    assert second.current_log_path() == log
+
+    first.invalidate()
+    second._preferred_log = None
+    assert second.current_log_path() is None
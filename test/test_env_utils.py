@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 
-from env_utils import env_bool
+from env_utils import env_bool, env_float
 
 
 def test_env_bool_truthy_and_falsy(monkeypatch) -> None:
@@ -22,3 +22,15 @@ def test_env_bool_truthy_and_falsy(monkeypatch) -> None:
     assert env_bool("X", default=True) is True
     assert env_bool("X", default=False) is False
 
+
+
+def test_env_float_falls_back_on_empty_or_invalid(monkeypatch) -> None:
+    monkeypatch.delenv("X", raising=False)
+    assert env_float("X", 2.0) == 2.0
+
+    monkeypatch.setenv("X", " 0.25 ")
+    assert env_float("X", 2.0) == 0.25
+
+    for v in ("", "soon"):
+        monkeypatch.setenv("X", v)
+        assert env_float("X", 2.0) == 2.0
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import laskd_daemon
+import session_file_watcher
+
+
+class _FakeSharedWatcher:
+    def __init__(self) -> None:
+        self.dirs: set[Path] = set()
+
+    def subscribe(self, directory: Path, event: threading.Event) -> bool:
+        self.dirs.add(directory)
+        return True
+
+    def unsubscribe(self, directory: Path, event: threading.Event) -> None:
+        self.dirs.discard(directory)
+
+
+def test_rewatch_log_follows_the_reader_to_another_project_dir(tmp_path: Path, monkeypatch) -> None:
+    shared = _FakeSharedWatcher()
+    monkeypatch.setattr(session_file_watcher, "_SHARED_WATCHER", shared)
+    first_dir, other_dir = tmp_path / "first", tmp_path / "other"
+    first_dir.mkdir()
+    other_dir.mkdir()
+    reader = laskd_daemon.ClaudeLogReader(root=tmp_path, work_dir=tmp_path)
+
+    watch = laskd_daemon._watch_log(reader, {"session_path": first_dir / "a.jsonl"})
+    assert watch is not None and reader.watches_session(first_dir / "a.jsonl")
+    assert shared.dirs == {first_dir}
+    assert laskd_daemon._rewatch_log(reader, {"session_path": first_dir / "b.jsonl"}, watch) is watch
+
+    moved = laskd_daemon._rewatch_log(reader, {"session_path": other_dir / "c.jsonl"}, watch)
+    assert moved is not None and moved[0] == other_dir
+    assert shared.dirs == {other_dir}
+    assert reader.watches_session(other_dir / "c.jsonl")
+    assert not reader.watches_session(first_dir / "a.jsonl")
+
+
+def test_worker_pool_reuses_session_key_until_session_file_changes(tmp_path: Path, monkeypatch) -> None:
+    session_file = tmp_path / ".ccb" / ".claude-session"
+    session_file.parent.mkdir()
+    session_file.write_text("{}", encoding="utf-8")
+    loads: list[Path] = []
+
+    class _Session:
+        data = {"ccb_project_id": "p1"}
+
+    monkeypatch.setattr(laskd_daemon, "load_project_session", lambda work_dir: loads.append(work_dir) or _Session())
+    pool = laskd_daemon._WorkerPool()
+
+    assert pool._session_key_for(tmp_path) == "claude:p1"
+    assert pool._session_key_for(tmp_path) == "claude:p1"
+    assert len(loads) == 1
+
+    session_file.write_text('{"changed": true}', encoding="utf-8")
+    assert pool._session_key_for(tmp_path) == "claude:p1"
+    assert len(loads) == 2
+
+
+def _queued(req_id: str, message: str) -> laskd_daemon._QueuedTask:
+    request = laskd_daemon.LaskdRequest(client_id="c", work_dir="/tmp", timeout_s=1.0, quiet=True, message=message)
+    return laskd_daemon._QueuedTask(request=request, created_ms=0, req_id=req_id, done_event=threading.Event())
+
+
+def test_session_worker_coalesces_identical_queued_requests(monkeypatch) -> None:
+    monkeypatch.setattr(laskd_daemon, "_COALESCE", True)
+    worker = laskd_daemon._SessionWorker("claude:p1")
+    current, same, other = _queued("r1", "hi"), _queued("r2", "hi"), _queued("r3", "bye")
+    worker.enqueue(same)
+    worker.enqueue(other)
+    result = laskd_daemon.LaskdResult(
+        exit_code=0,
+        reply="hello",
+        req_id="r1",
+        session_key="claude:p1",
+        done_seen=True,
+        done_ms=10,
+        anchor_seen=True,
+        anchor_ms=5,
+    )
+
+    worker._coalesce_queued(current, result)
+    assert same.done_event.is_set()
+    assert same.result is not None and same.result.reply == "hello" and same.result.req_id == "r2"
+    assert not same.result.anchor_seen and same.result.anchor_ms is None and same.result.done_ms != 10
+    assert not other.done_event.is_set()
+
+    monkeypatch.setattr(laskd_daemon, "_COALESCE", False)
+    later = _queued("r4", "hi")
+    worker.enqueue(later)
+    worker._coalesce_queued(current, result)
+    assert not later.done_event.is_set()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import laskd_registry
+from laskd_registry import LaskdSessionRegistry, _scan_latest_log_for_work_dir
+from laskd_session import ClaudeProjectSession
+
+
+def _write_log(path: Path, cwd: Path, *, sidechain: bool = False, mtime: float = 0.0) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {"type": "user", "cwd": str(cwd), "sessionId": path.stem, "isSidechain": sidechain}
+    path.write_text(json.dumps(entry) + "\n", encoding="utf-8")
+    if mtime:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_scan_latest_prunes_hidden_and_subagent_logs(tmp_path: Path) -> None:
+    root = tmp_path / "projects"
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    project = root / laskd_registry._project_key_for_path(work_dir)
+    main = _write_log(project / "main.jsonl", work_dir, mtime=100)
+    _write_log(project / "main" / "subagents" / "agent-1.jsonl", work_dir, sidechain=True, mtime=300)
+    _write_log(project / ".hidden.jsonl", work_dir, mtime=400)
+    _write_log(root / "other" / "newer.jsonl", tmp_path / "elsewhere", mtime=200)
+
+    assert sorted(Path(p).name for _, p in laskd_registry._iter_session_logs(str(root))) == ["main.jsonl", "newer.jsonl"]
+    assert _scan_latest_log_for_work_dir(work_dir, root=root, scan_limit=1) == (None, None)
+    assert _scan_latest_log_for_work_dir(work_dir, root=root, scan_limit=2) == (main, "main")
+
+
+def test_sessions_index_is_reparsed_only_when_it_changes(tmp_path: Path, monkeypatch) -> None:
+    root = tmp_path / "projects"
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    project = root / laskd_registry._project_key_for_path(work_dir)
+    first = _write_log(project / "first.jsonl", work_dir)
+    second = _write_log(project / "second.jsonl", work_dir)
+    index = project / "sessions-index.json"
+    entries = [
+        {"fullPath": str(first), "projectPath": str(work_dir), "fileMtime": 200},
+        {"fullPath": "second.jsonl", "projectPath": str(work_dir), "fileMtime": 100},
+    ]
+    index.write_text(json.dumps({"entries": entries}), encoding="utf-8")
+
+    loads = []
+    real_load = laskd_registry._load_sessions_index
+    monkeypatch.setattr(laskd_registry, "_load_sessions_index", lambda *a: loads.append(1) or real_load(*a))
+
+    assert laskd_registry._parse_sessions_index(work_dir, root=root) == first
+    assert laskd_registry._parse_sessions_index(work_dir, root=root) == first
+    assert len(loads) == 1
+
+    first.unlink()
+    assert laskd_registry._parse_sessions_index(work_dir, root=root) == second
+    assert len(loads) == 1
+
+    entries.append({"fullPath": str(first), "projectPath": str(work_dir), "fileMtime": 300})
+    index.write_text(json.dumps({"entries": entries}), encoding="utf-8")
+    _write_log(first, work_dir)
+    assert laskd_registry._parse_sessions_index(work_dir, root=root) == first
+    assert len(loads) == 2
+
+
+def test_event_binding_is_not_rescanned_by_the_monitor(tmp_path: Path) -> None:
+    work_dir = tmp_path / "work"
+    session_file = work_dir / ".ccb" / ".claude-session"
+    session_file.parent.mkdir(parents=True)
+    session_file.write_text(json.dumps({"work_dir": str(work_dir)}), encoding="utf-8")
+    session = ClaudeProjectSession(session_file=session_file, data={"work_dir": str(work_dir)})
+    registry = LaskdSessionRegistry(claude_root=tmp_path / "projects")
+    registry.register_session(work_dir, session)
+
+    log = _write_log(tmp_path / "projects" / "p" / "new-id.jsonl", work_dir)
+    registry._on_new_log_file_global(log)
+
+    entry = registry._sessions[str(work_dir)]
+    assert session.claude_session_path == str(log)
+    assert entry.file_mtime == session_file.stat().st_mtime
+    assert entry.next_bind_refresh > 0.0
+
+
+def test_find_log_for_session_id_prefers_the_work_dir_project(tmp_path: Path) -> None:
+    root = tmp_path / "projects"
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    sid = "0199a1b2-c3d4-7e5f-8a9b-0c1d2e3f4a5b"
+    own = _write_log(root / laskd_registry._project_key_for_path(work_dir) / f"{sid}.jsonl", work_dir, mtime=100)
+    other = _write_log(root / "other" / f"{sid}.jsonl", work_dir, mtime=200)
+    renamed = _write_log(root / "other" / "nested" / f"copy-{sid}-2.jsonl", work_dir, mtime=300)
+
+    assert laskd_registry._find_log_for_session_id(sid, root=root, work_dir=work_dir) == own
+    assert laskd_registry._find_log_for_session_id(sid, root=root) == other
+    other.unlink()
+    own.unlink()
+    assert laskd_registry._find_log_for_session_id(sid, root=root, work_dir=work_dir) == renamed
+
+
+def test_get_session_loads_outside_the_registry_lock(tmp_path: Path, monkeypatch) -> None:
+    registry = LaskdSessionRegistry(claude_root=tmp_path / "projects")
+    held = []
+
+    def _load(work_dir: Path):
+        held.append(registry._lock.locked())
+        return None
+
+    monkeypatch.setattr(laskd_registry, "load_project_session", _load)
+    assert registry.get_session(tmp_path) is None
+    assert held == [False]
+    assert str(tmp_path) in registry._sessions
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import session_file_watcher
+
+
+class _FakeWatcher:
+    instances: list["_FakeWatcher"] = []
+
+    def __init__(self, project_dir: Path, callback) -> None:
+        self.project_dir = project_dir
+        self.callback = callback
+        self.started = False
+        self.stopped = False
+        _FakeWatcher.instances.append(self)
+
+    def start(self) -> None:
+        self.started = True
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+def test_shared_watcher_fans_out_and_stops_with_last_subscriber(tmp_path: Path, monkeypatch) -> None:
+    _FakeWatcher.instances = []
+    monkeypatch.setattr(session_file_watcher, "HAS_WATCHDOG", True)
+    monkeypatch.setattr(session_file_watcher, "SessionFileWatcher", _FakeWatcher)
+    shared = session_file_watcher.SharedSessionFileWatcher()
+    first, second = threading.Event(), threading.Event()
+
+    assert shared.subscribe(tmp_path, first)
+    assert shared.subscribe(tmp_path, second)
+    assert len(_FakeWatcher.instances) == 1
+    watcher = _FakeWatcher.instances[0]
+    assert watcher.started
+
+    watcher.callback(tmp_path / "session.jsonl")
+    assert first.is_set() and second.is_set()
+
+    shared.unsubscribe(tmp_path, first)
+    assert not watcher.stopped
+    shared.unsubscribe(tmp_path, second)
+    assert watcher.stopped
+
+
+def test_shared_watcher_is_a_noop_without_watchdog(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(session_file_watcher, "HAS_WATCHDOG", False)
+    shared = session_file_watcher.SharedSessionFileWatcher()
+
+    assert not shared.subscribe(tmp_path, threading.Event())
+    shared.unsubscribe(tmp_path, threading.Event())
@@ -155,3 +155,24 @@ def test_tmux_kill_pane_prefers_pane_id_over_session(monkeypatch: pytest.MonkeyP
     calls.clear()
     backend.kill_pane("mysession")
     assert calls == [["kill-session", "-t", "mysession"]]
+
+
+def test_tmux_probe_reads_liveness_and_text_in_one_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_tmux_run(self: terminal.TmuxBackend, args: list[str], *, check: bool = False, capture: bool = False,
+                      input_bytes: bytes | None = None, timeout: float | None = None) -> subprocess.CompletedProcess[str]:
+        calls.append(args)
+        if args[4] == "#{pane_dead}" and args[3] == "%1":
+            return _cp(stdout="0\n\x1b[1mhello\x1b[0m\nworld\n")
+        return _cp(stdout="1\nbye\n")
+
+    backend = terminal.TmuxBackend()
+    monkeypatch.setattr(backend, "_tmux_run", fake_tmux_run.__get__(backend, terminal.TmuxBackend))
+
+    assert backend.probe("%1", lines=15) == (True, "hello\nworld\n")
+    assert calls[0] == [
+        "display-message", "-p", "-t", "%1", "#{pane_dead}", ";", "capture-pane", "-t", "%1", "-p", "-S", "-15",
+    ]
+    assert backend.probe("%2", lines=15) == (False, None)
+    assert len(calls) == 2
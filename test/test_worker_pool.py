@@ -77,3 +77,20 @@ def test_base_session_worker_exception_path() -> None:
         worker.stop()
         worker.join(timeout=2.0)
 
+
+def test_base_session_worker_skips_tasks_resolved_while_queued() -> None:
+    worker = _EchoWorker("s1")
+    resolved = _Task(req_id="r3", done_event=threading.Event(), result="shared")
+    resolved.done_event.set()
+    pending = _Task(req_id="r4", done_event=threading.Event())
+    worker.enqueue(resolved)
+    worker.enqueue(pending)
+    assert worker.queued_tasks() == [resolved, pending]
+    worker.start()
+    try:
+        assert pending.done_event.wait(timeout=2.0) is True
+        assert resolved.result == "shared"
+        assert pending.result == "ok:r4"
+    finally:
+        worker.stop()
+        worker.join(timeout=2.0)